@@ -4,24 +4,67 @@ Handles configuration validation and default values
 """
 
 import os
+import time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
-# Default configurations
-DEFAULT_CONFIG = {
+# fastjsonschema compiles the schema to Python code once; fall back to the field checks when it is not installed
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Default configurations (read-only; apply_defaults builds a fresh dict per job)
+DEFAULT_CONFIG = MappingProxyType({
     "ffmpeg_path": "ffmpeg",
     "whisper_model": "base",
     "language": "English",
     "device": "cpu",
-    "fp16": False,
+    "backend": "faster-whisper",
+    "fp16": None,  # None = auto (on for CUDA GPUs with compute capability 7.0+)
     "task": "transcribe",
-    "output_format": "srt"
-}
+    "output_format": "srt",
+    "batch_size": 8,
+    "keep_wav": False,
+    "quantize": True
+})
 
 # Valid values
-VALID_MODELS = ["tiny", "base", "small", "medium", "large"]
-VALID_FORMATS = ["srt", "vtt", "txt", "json"]
-VALID_TASKS = ["transcribe", "translate"]
-VALID_DEVICES = ["cpu", "cuda"]
+VALID_MODELS = frozenset({"tiny", "base", "small", "medium", "large"})
+VALID_FORMATS = frozenset({"srt", "vtt", "txt", "json"})
+VALID_TASKS = frozenset({"transcribe", "translate"})
+VALID_DEVICES = frozenset({"cpu", "cuda", "mps", "xpu", "directml", "auto"})
+VALID_BACKENDS = frozenset({"faster-whisper", "openai-whisper", "onnx"})
+
+# Approximate VRAM needed per loaded model, used to size parallel GPU batches
+MODEL_VRAM_BYTES = {
+    "tiny": 1 * 1024**3,
+    "base": 1 * 1024**3,
+    "small": 2 * 1024**3,
+    "medium": 5 * 1024**3,
+    "large": 10 * 1024**3,
+}
+
+# Enumerated fields checked by validate_config: (config key, default, allowed values, label)
+ENUM_FIELDS = (
+    ("whisper_model", "base", VALID_MODELS, "model"),
+    ("output_format", "srt", VALID_FORMATS, "format"),
+    ("task", "transcribe", VALID_TASKS, "task"),
+    ("device", "cpu", VALID_DEVICES, "device"),
+    ("backend", "faster-whisper", VALID_BACKENDS, "backend"),
+)
+
+# Allowed-value listings for error messages, formatted once at import
+_ALLOWED_REPR = {key: str(sorted(allowed)) for key, _, allowed, _ in ENUM_FIELDS}
+
+# Same rules as the field checks, as a JSON schema compiled once at import
+CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["input_file", "output_dir"],
+    "properties": {key: {"enum": sorted(allowed)} for key, _, allowed, _ in ENUM_FIELDS},
+}
+_schema_validator = fastjsonschema.compile(CONFIG_SCHEMA) if fastjsonschema is not None else None
 
 # Language mappings
 LANGUAGE_CODES = {
@@ -36,6 +79,42 @@ LANGUAGE_CODES = {
     "auto": None  # Auto-detect
 }
 
+# Case-insensitive lookup table, built once at import
+_LANGUAGE_LOOKUP = {name.casefold(): code for name, code in LANGUAGE_CODES.items()}
+
+
+# Short-lived cache of successful path existence checks (path -> checked_at)
+STAT_CACHE_TTL = 1.0  # seconds
+_stat_cache: Dict[str, float] = {}
+
+
+def _exists_cached(path: str) -> bool:
+    """
+    os.path.exists with a short TTL cache. Only hits are cached: a file that
+    lands right after a failed check must be found on the next job.
+    """
+    now = time.monotonic()
+    checked_at = _stat_cache.get(path)
+    if checked_at is not None and now - checked_at < STAT_CACHE_TTL:
+        return True
+    
+    if not os.path.exists(path):
+        _stat_cache.pop(path, None)
+        return False
+    _stat_cache[path] = now
+    return True
+
+
+def _schema_valid(config: Dict[str, Any]) -> bool:
+    """Fast pass/fail check with the compiled schema (False when fastjsonschema is unavailable)"""
+    if _schema_validator is None:
+        return False
+    try:
+        _schema_validator(config)
+        return True
+    except fastjsonschema.JsonSchemaException:
+        return False
+
 
 def validate_config(config: Dict[str, Any]) -> tuple[bool, Optional[str]]:
     """
@@ -43,6 +122,13 @@ def validate_config(config: Dict[str, Any]) -> tuple[bool, Optional[str]]:
     Returns: (is_valid, error_message)
     """
     
+    # Valid configs only need the file check; anything else goes through the
+    # field checks below, which produce the error message
+    if _schema_valid(config):
+        if not _exists_cached(config["input_file"]):
+            return False, f"Input file not found: {config['input_file']}"
+        return True, None
+    
     # Check required fields
     if "input_file" not in config:
         return False, "Missing required field: input_file"
@@ -51,40 +137,24 @@ def validate_config(config: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         return False, "Missing required field: output_dir"
     
     # Check input file exists
-    if not os.path.exists(config["input_file"]):
+    if not _exists_cached(config["input_file"]):
         return False, f"Input file not found: {config['input_file']}"
     
-    # Validate model
-    model = config.get("whisper_model", "base")
-    if model not in VALID_MODELS:
-        return False, f"Invalid model: {model}. Must be one of {VALID_MODELS}"
-    
-    # Validate format
-    output_format = config.get("output_format", "srt")
-    if output_format not in VALID_FORMATS:
-        return False, f"Invalid format: {output_format}. Must be one of {VALID_FORMATS}"
-    
-    # Validate task
-    task = config.get("task", "transcribe")
-    if task not in VALID_TASKS:
-        return False, f"Invalid task: {task}. Must be one of {VALID_TASKS}"
-    
-    # Validate device
-    device = config.get("device", "cpu")
-    if device not in VALID_DEVICES:
-        return False, f"Invalid device: {device}. Must be one of {VALID_DEVICES}"
+    # Validate model, format, task, device and backend
+    for key, default, allowed, label in ENUM_FIELDS:
+        value = config.get(key, default)
+        if not isinstance(value, str) or value not in allowed:
+            return False, f"Invalid {label}: {value}. Must be one of {_ALLOWED_REPR[key]}"
     
     return True, None
 
 
 def apply_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
     """Apply default values to missing config keys"""
-    result = DEFAULT_CONFIG.copy()
-    result.update(config)
-    return result
+    return {**DEFAULT_CONFIG, **config}
 
 
-def get_language_code(language: str) -> Optional[str]:
-    """Convert language name to Whisper language code"""
-    lang_lower = language.lower()
-    return LANGUAGE_CODES.get(lang_lower, None)
+@lru_cache(maxsize=64)
+def get_language_code(language: str, default: Optional[str] = None) -> Optional[str]:
+    """Convert language name to Whisper language code (default for unknown names)"""
+    return _LANGUAGE_LOOKUP.get(language.casefold(), default)
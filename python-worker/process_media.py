@@ -9,10 +9,18 @@ import os
 import json
 import base64
 import argparse
+import importlib.util
+import shutil
 import subprocess
 import logging
+import threading
+import time
 import traceback
+import types
 import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -20,10 +28,30 @@ from datetime import datetime
 # Disable tqdm progress bars globally (Whisper uses tqdm)
 os.environ['TQDM_DISABLE'] = '1'
 
+# orjson is much faster than the stdlib encoder; fall back to json when it is not installed
+try:
+    import orjson
+
+    def dumps_json(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def dumps_json_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+    loads_json = orjson.loads
+except ImportError:
+    def dumps_json(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def dumps_json_pretty(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+    loads_json = json.loads
+
 # Try to import config module (optional)
 try:
     import config
-    from config import apply_defaults, validate_config
+    from config import apply_defaults, validate_config, get_language_code
     CONFIG_MODULE_AVAILABLE = True
 except ImportError:
     CONFIG_MODULE_AVAILABLE = False
@@ -32,6 +60,64 @@ except ImportError:
 # Global variable for job ID (used in progress reporting)
 job_id = None
 
+# Last (ms, counter) handed out by new_job_id, so IDs stay ordered within a millisecond
+_job_id_state = {"ms": 0, "counter": 0}
+_job_id_lock = threading.Lock()
+
+# Loaded Whisper models, reused across jobs in --stdin-mode
+_model_cache: Dict[tuple, Any] = {}
+
+# Serializes background model loads (see preload_model), so a model still loading for a
+# failed job is picked up from _model_cache by the next one
+_model_load_lock = threading.Lock()
+
+
+# FFmpeg output is read in chunks of this size; the whole run is killed after FFMPEG_TIMEOUT
+PCM_READ_CHUNK = 1 << 20  # 1 MiB
+FFMPEG_TIMEOUT = 3600  # 1 hour
+
+# Progress file writes are skipped when nothing meaningful changed within this interval
+PROGRESS_WRITE_INTERVAL = 0.5  # seconds (the C# host polls every 500 ms)
+
+# Progress files are written next to this script, where the C# host polls for them
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Progress file writer for the current job (see get_progress_writer)
+_progress_writer = None
+
+
+def new_job_id() -> str:
+    """
+    Generate a time-ordered job ID (UUIDv7 layout: 48-bit Unix ms timestamp + random bits).
+    IDs - and the {job_id}_progress.json files named after them - sort by creation time,
+    also within one millisecond: the 12-bit rand_a field is a counter (RFC 9562, method 1).
+    """
+    if hasattr(uuid, "uuid7"):  # Python 3.14+ (monotonic as well)
+        return str(uuid.uuid7())
+    
+    with _job_id_lock:
+        unix_ms = max(time.time_ns() // 1_000_000, _job_id_state["ms"])
+        if unix_ms == _job_id_state["ms"]:
+            counter = _job_id_state["counter"] + 1
+            if counter > 0xFFF:  # Counter exhausted: borrow the next millisecond
+                unix_ms += 1
+                counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Seed with 11 random bits, leaving headroom for increments within the millisecond
+            counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        _job_id_state["ms"] = unix_ms
+        _job_id_state["counter"] = counter
+    
+    rand = int.from_bytes(os.urandom(8), "big")
+    value = (
+        (unix_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76                           # version 7
+        | counter << 64                       # 12-bit counter
+        | 0b10 << 62                          # RFC 4122 variant
+        | rand & 0x3FFFFFFFFFFFFFFF           # 62 random bits
+    )
+    return str(uuid.UUID(int=value))
+
 
 def setup_logging(log_dir: str = "logs"):
     """Setup logging configuration"""
@@ -84,26 +170,17 @@ def report_progress(phase: str, percent: int, message: str):
         "phase": phase,
         "percent": percent,
         "message": message,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": int(time.time() * 1000)  # Unix epoch milliseconds
     }
     
     # Output to stdout (original method)
-    print(json.dumps(progress), flush=True)
+    emit_json(progress)
     
     # ALSO write to progress file for reliable reading
     try:
         if job_id is not None:
-            # Get the directory where THIS script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            progress_file = os.path.join(script_dir, f"{job_id}_progress.json")
-            
-            print(f"🔍 DEBUG: Script dir for progress: {script_dir}", file=sys.stderr, flush=True)
-            print(f"🔍 DEBUG: Progress file path: {progress_file}", file=sys.stderr, flush=True)
-            logging.debug(f"📝 Writing progress to: {progress_file}")
-            
-            with open(progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress, f, ensure_ascii=False, indent=2)
-            print(f"✅ DEBUG: Progress file written successfully", file=sys.stderr, flush=True)
+            if get_progress_writer().write(progress):
+                logging.debug("📝 Progress file updated")
         else:
             print(f"⚠️  DEBUG: job_id is None, cannot write progress file", file=sys.stderr, flush=True)
     except Exception as e:
@@ -111,6 +188,111 @@ def report_progress(phase: str, percent: int, message: str):
         logging.warning(f"⚠️  Could not write progress file: {e}")
 
 
+class ProgressWriter:
+    """
+    Publishes a job's progress snapshots atomically: each update is written to a temp file
+    and renamed over the target with os.replace, so a reader sees either the previous or the
+    new document, never a partial one. (The C# poller opens the file with FileShare.Delete,
+    which lets the rename succeed on Windows while it is reading.)
+    
+    Within the same phase the file is written at most once per PROGRESS_WRITE_INTERVAL; a
+    phase change is always written immediately. A throttled snapshot is written by a timer
+    once the interval has passed (or on close), so the file never stays behind the last
+    update - even when no further update follows, as during a long transcription step.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._tmp_path = path + ".tmp"
+        self._last_time = 0.0
+        self._last_phase = None
+        self._pending = None
+        self._timer = None
+        self._lock = threading.Lock()
+    
+    def write(self, progress: Dict[str, Any]) -> bool:
+        """Write a progress snapshot. Returns: False if the update was throttled"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._last_time + PROGRESS_WRITE_INTERVAL - now
+            if progress["phase"] == self._last_phase and wait > 0:
+                self._pending = progress
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self._flush_pending)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return False
+            
+            self._write(progress, now)
+            return True
+    
+    def _flush_pending(self):
+        with self._lock:
+            self._timer = None
+            self._write_pending()
+    
+    def _write_pending(self):
+        """Write the throttled snapshot, if any; a failure (AV/indexer lock, full disk) is only logged"""
+        if self._pending is not None:
+            try:
+                self._write(self._pending, time.monotonic())
+            except OSError as e:
+                logging.warning(f"⚠️  Could not write progress file: {e}")
+    
+    def _write(self, progress: Dict[str, Any], now: float):
+        with open(self._tmp_path, 'wb') as f:
+            f.write(dumps_json(progress))
+        os.replace(self._tmp_path, self.path)
+        
+        self._last_time = now
+        self._last_phase = progress["phase"]
+        self._pending = None
+    
+    def close(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._write_pending()
+
+
+def get_progress_writer() -> ProgressWriter:
+    """Return the progress writer for the current job_id, opening it on first use"""
+    global _progress_writer
+    
+    progress_file = os.path.join(SCRIPT_DIR, f"{job_id}_progress.json")
+    
+    if _progress_writer is None or _progress_writer.path != progress_file:
+        close_progress_writer()
+        print(f"🔍 DEBUG: Progress file path: {progress_file}", file=sys.stderr, flush=True)
+        _progress_writer = ProgressWriter(progress_file)
+    return _progress_writer
+
+
+def close_progress_writer():
+    """Flush and release the current job's progress writer (called when the job finishes)"""
+    global _progress_writer
+    if _progress_writer is not None:
+        _progress_writer.close()
+        _progress_writer = None
+
+
+def read_small_json(path: str) -> Any:
+    """Read a small JSON file (progress/config) with a single plain read"""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def emit_json(obj: Dict[str, Any]):
+    """
+    Write one JSON line to stdout as a single pre-encoded write and flush it right away.
+    Lines are not batched: each update usually precedes a long blocking step, and the
+    C# host should see it before that step starts.
+    """
+    sys.stdout.buffer.write(dumps_json(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def report_result(success: bool, wav_file: Optional[str] = None, 
                   subtitle_file: Optional[str] = None, 
                   error: Optional[str] = None,
@@ -126,7 +308,7 @@ def report_result(success: bool, wav_file: Optional[str] = None,
                 "metadata": metadata or {}
             }
         }
-        print(json.dumps(result), flush=True)
+        emit_json(result)
         
         if success:
             logging.info(f"✅ SUCCESS: Generated subtitle file: {subtitle_file}")
@@ -138,165 +320,281 @@ def report_result(success: bool, wav_file: Optional[str] = None,
         logging.error(f"❌ Failed to report result: {e}")
 
 
-def extract_audio(input_file: str, output_wav: str, ffmpeg_path: str = "ffmpeg") -> bool:
-    """Extract audio from video using FFmpeg"""
+def detect_container(path: str) -> str:
+    """Identify the media container from its magic bytes ("unknown" if unreadable)"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(16)
+    except OSError as e:
+        logging.debug(f"⚠️  Could not read media header: {e}")
+        return "unknown"
+    
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:4] == b"RIFF" and header[8:12] == b"AVI ":
+        return "avi"
+    if header[4:8] == b"ftyp":
+        return "mp4"
+    if header[:4] == b"\x1a\x45\xdf\xa3":
+        return "matroska"
+    if header[:3] == b"FLV":
+        return "flv"
+    if header[:4] == b"\x30\x26\xb2\x75":
+        return "asf"
+    if header[:4] == b"OggS":
+        return "ogg"
+    if header[:4] == b"fLaC":
+        return "flac"
+    if header[:3] == b"ID3" or header[:2] in (b"\xff\xfb", b"\xff\xf3", b"\xff\xf2"):
+        return "mp3"
+    return "unknown"
+
+
+def is_whisper_ready_wav(path: str) -> bool:
+    """True if a WAV file is already in Whisper's input format (16kHz, mono, 16-bit PCM)"""
+    import wave
+    try:
+        with wave.open(path, "rb") as w:
+            return (w.getframerate() == 16000 and w.getnchannels() == 1
+                    and w.getsampwidth() == 2 and w.getcomptype() == "NONE")
+    except (wave.Error, EOFError, OSError):
+        # Not plain PCM (e.g. float or compressed WAV) - let FFmpeg convert it
+        return False
+
+
+def reuse_wav(input_file: str, output_wav: str) -> str:
+    """
+    Hard-link the input WAV to output_wav (copy across volumes); returns output_wav.
+    The link/copy goes to a temp name that is then renamed over output_wav, so an existing
+    output_wav is never deleted first - it may be the input itself under another path
+    (case difference on Windows, symlink or junction).
+    """
+    if os.path.exists(output_wav) and os.path.samefile(input_file, output_wav):
+        return output_wav
+    
+    tmp_wav = output_wav + ".tmp"
+    if os.path.lexists(tmp_wav):
+        os.remove(tmp_wav)
+    try:
+        os.link(input_file, tmp_wav)
+        linked = True
+    except OSError:
+        shutil.copyfile(input_file, tmp_wav)
+        linked = False
+    os.replace(tmp_wav, output_wav)
+    logging.info(f"{'🔗 Linked' if linked else '📋 Copied'} input WAV to {output_wav}")
+    return output_wav
+
+
+def run_ffmpeg(cmd: list, timeout: float = FFMPEG_TIMEOUT):
+    """
+    Run FFmpeg, reading stdout in large chunks into one buffer (stderr is drained on a thread
+    so neither pipe can fill up and block FFmpeg).
+    Returns: (returncode, stdout bytearray, stderr bytes); raises subprocess.TimeoutExpired
+    """
+    process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    stderr_chunks = []
+    stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    stderr_thread.start()
+    
+    timed_out = threading.Event()
+    
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+    
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+    stdout = bytearray()
+    try:
+        while True:
+            chunk = process.stdout.read(PCM_READ_CHUNK)
+            if not chunk:
+                break
+            stdout += chunk
+        process.wait()
+    finally:
+        timer.cancel()
+        stderr_thread.join()
+        process.stdout.close()
+        process.stderr.close()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return process.returncode, stdout, b"".join(stderr_chunks)
+
+
+def extraction_possible(input_file: str, ffmpeg_path: str) -> bool:
+    """Cheap pre-check: the input exists and FFmpeg can be found (or is not needed for a ready WAV)"""
+    if not os.path.isfile(input_file):
+        return False
+    if shutil.which(ffmpeg_path) is not None:
+        return True
+    return detect_container(input_file) == "wav" and is_whisper_ready_wav(input_file)
+
+
+def extract_audio(input_file: str, output_wav: Optional[str], ffmpeg_path: str = "ffmpeg"):
+    """
+    Extract audio from video using FFmpeg (16kHz mono).
+    With output_wav the audio is written to a WAV file; without it FFmpeg streams raw PCM
+    over stdout straight into memory and no file is written.
+    Returns: the WAV path or a float32 sample array, or None on failure
+    """
     try:
         logging.info("=" * 60)
         logging.info("🎬 STEP 1: AUDIO EXTRACTION")
         logging.info("=" * 60)
         logging.info(f"📁 Input video: {input_file}")
-        logging.info(f"🔊 Output audio: {output_wav}")
+        logging.info(f"🔊 Output audio: {output_wav or 'in-memory PCM'}")
         logging.info(f"🛠️  FFmpeg path: {ffmpeg_path}")
         
         report_progress("converting", 10, "Starting audio extraction...")
         
-        # Validate input file
-        if not os.path.exists(input_file):
+        # Validate input file (a single stat both checks existence and gives the size)
+        try:
+            file_size = os.stat(input_file).st_size
+        except FileNotFoundError:
             error_msg = f"Input file not found: {input_file}"
             logging.error(f"❌ {error_msg}")
             raise FileNotFoundError(error_msg)
         
-        file_size = os.path.getsize(input_file)
         logging.info(f"📊 Input file size: {file_size:,} bytes ({file_size / (1024*1024):.2f} MB)")
-        
-        # FFmpeg command to extract audio as WAV (16kHz, mono)
+        container = detect_container(input_file)
+        logging.info(f"📦 Container: {container}")
+        
+        # A WAV that is already 16kHz mono 16-bit PCM needs no FFmpeg pass at all
+        if container == "wav" and is_whisper_ready_wav(input_file):
+            logging.info("⚡ Input is already 16kHz mono PCM WAV, skipping FFmpeg")
+            audio = reuse_wav(input_file, output_wav) if output_wav else read_wav_samples(input_file)
+            report_progress("converting", 50, "Audio extraction completed")
+            logging.info("=" * 60)
+            return audio
+        
+        # FFmpeg command to extract audio as 16kHz mono PCM, to a WAV file or raw to stdout
         cmd = [
             ffmpeg_path,
+            "-nostdin", "-hide_banner",  # No stdin polling, no banner
+            "-loglevel", "error",  # Only errors on stderr (no per-frame stats)
+            "-threads", "0",  # Decode with all cores
             "-i", input_file,
-            "-vn",  # No video
+            "-map", "0:a:0",  # First audio stream only
+            "-vn", "-sn", "-dn",  # No video, subtitle or data streams
             "-acodec", "pcm_s16le",  # PCM 16-bit
             "-ar", "16000",  # 16kHz sample rate
             "-ac", "1",  # Mono
-            "-y",  # Overwrite output
-            output_wav
         ]
+        if output_wav:
+            cmd += ["-f", "wav", "-y", output_wav]  # Overwrite output
+        else:
+            cmd += ["-f", "s16le", "-"]  # Raw samples on stdout
         
         logging.debug(f"🔧 FFmpeg command: {' '.join(cmd)}")
-        logging.info("⏳ Running FFmpeg to extract audio (16kHz mono WAV)...")
+        logging.info("⏳ Running FFmpeg to extract audio (16kHz mono PCM)...")
         report_progress("converting", 25, "Extracting audio with FFmpeg...")
         
-        # Run FFmpeg
+        # Run FFmpeg (output captured as bytes; stderr is decoded once, only on failure)
         logging.debug("🚀 Starting FFmpeg subprocess...")
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=3600  # 1 hour timeout
-        )
+        returncode, pcm, stderr = run_ffmpeg(cmd)
         
-        if result.returncode != 0:
-            error_msg = f"FFmpeg failed with exit code {result.returncode}"
+        if returncode != 0:
+            stderr_text = stderr.decode('utf-8', 'replace')
+            error_msg = f"FFmpeg failed with exit code {returncode}"
             logging.error(f"❌ {error_msg}")
-            logging.error(f"📋 FFmpeg stderr: {result.stderr[:500]}")  # First 500 chars
-            print(f"FFmpeg error: {result.stderr}", file=sys.stderr)
-            return False
+            logging.error(f"📋 FFmpeg stderr: {stderr_text[:500]}")  # First 500 chars
+            print(f"FFmpeg error: {stderr_text}", file=sys.stderr)
+            return None
         
         logging.info(f"✅ FFmpeg completed successfully (exit code 0)")
         
-        # Verify output file
-        if not os.path.exists(output_wav):
-            error_msg = f"Output WAV file was not created: {output_wav}"
-            logging.error(f"❌ {error_msg}")
-            return False
-        
-        wav_size = os.path.getsize(output_wav)
-        logging.info(f"✅ WAV file created successfully")
-        logging.info(f"📊 WAV file size: {wav_size:,} bytes ({wav_size / (1024*1024):.2f} MB)")
+        if output_wav:
+            # Verify output file
+            if not os.path.exists(output_wav):
+                error_msg = f"Output WAV file was not created: {output_wav}"
+                logging.error(f"❌ {error_msg}")
+                return None
+            
+            audio = output_wav
+            audio_size = os.path.getsize(output_wav)
+            logging.info(f"✅ WAV file created successfully")
+            logging.info(f"📊 WAV file size: {audio_size:,} bytes ({audio_size / (1024*1024):.2f} MB)")
+        else:
+            import numpy as np
+            audio = np.frombuffer(pcm, np.int16).astype(np.float32)
+            audio /= 32768.0
+            audio_size = len(pcm)
+            logging.info(f"✅ Decoded {len(audio) / 16000:.2f} seconds of audio in memory")
+            logging.info(f"📊 PCM size: {audio_size:,} bytes ({audio_size / (1024*1024):.2f} MB)")
         
         # Calculate compression ratio
-        compression_ratio = (1 - wav_size / file_size) * 100
+        compression_ratio = (1 - audio_size / file_size) * 100
         logging.info(f"📉 Size reduction: {compression_ratio:.1f}%")
         
         report_progress("converting", 50, "Audio extraction completed")
         logging.info("=" * 60)
-        return True
+        return audio
         
     except subprocess.TimeoutExpired:
         error_msg = "FFmpeg timed out (exceeded 1 hour)"
         logging.error(f"⏱️ {error_msg}")
         print(error_msg, file=sys.stderr)
-        return False
+        return None
     except FileNotFoundError as e:
         logging.error(f"❌ File not found: {e}")
         print(f"File error: {str(e)}", file=sys.stderr)
-        return False
+        return None
     except Exception as e:
         error_msg = f"Audio extraction failed: {str(e)}"
         logging.error(f"❌ {error_msg}")
         logging.debug(f"📋 Stack trace:\n{traceback.format_exc()}")
         print(error_msg, file=sys.stderr)
-        return False
+        return None
 
 
-def transcribe_audio(wav_file: str, output_file: str, config: Dict[str, Any]) -> bool:
-    """Transcribe audio using Whisper AI"""
+def transcribe_audio(audio, output_file: str, config: Dict[str, Any], model_future: Optional[Future] = None) -> bool:
+    """
+    Transcribe audio using Whisper AI (audio: WAV path or 16kHz float32 samples from extract_audio).
+    model_future comes from preload_model() and is already loading the model; without it the model is loaded here.
+    """
     try:
         logging.info("=" * 60)
         logging.info("🤖 STEP 2: TRANSCRIPTION WITH WHISPER AI")
         logging.info("=" * 60)
-        logging.info(f"📁 Input WAV: {wav_file}")
+        logging.info(f"📁 Input audio: {audio if isinstance(audio, str) else 'in-memory PCM'}")
         logging.info(f"📄 Output subtitle: {output_file}")
         
-        # Import Whisper
+        if isinstance(audio, str):
+            # Validate WAV file
+            if not os.path.exists(audio):
+                error_msg = f"WAV file not found: {audio}"
+                logging.error(f"❌ {error_msg}")
+                raise FileNotFoundError(error_msg)
+            
+            wav_size = os.path.getsize(audio)
+            logging.info(f"📊 WAV file size: {wav_size:,} bytes ({wav_size / (1024*1024):.2f} MB)")
+            
+            # Calculate estimated audio duration (16kHz mono, 16-bit)
+            bytes_per_second = 16000 * 2  # 16kHz * 2 bytes per sample
+            estimated_duration = wav_size / bytes_per_second
+        else:
+            estimated_duration = len(audio) / 16000
+        logging.info(f"⏱️  Estimated audio duration: {estimated_duration:.2f} seconds ({estimated_duration/60:.2f} minutes)")
+        
+        report_progress("transcribing", 55, "Loading Whisper model...")
+        
+        # Use the model preloaded during audio extraction, or load it now
         try:
-            import whisper
-            import torch
-            logging.info("✅ Whisper and Torch imported successfully")
-            logging.debug(f"🔍 Whisper version: {whisper.__version__ if hasattr(whisper, '__version__') else 'unknown'}")
-            logging.debug(f"🔍 PyTorch version: {torch.__version__}")
+            loaded = model_future.result() if model_future is not None else prepare_model(config)
         except ImportError as e:
-            error_msg = f"Whisper import failed: {str(e)}. Please install: pip install openai-whisper torch"
+            error_msg = f"Whisper import failed: {str(e)}. Please install: pip install -r requirements.txt"
             logging.error(f"❌ {error_msg}")
             print(error_msg, file=sys.stderr)
             return False
         
-        # Validate WAV file
-        if not os.path.exists(wav_file):
-            error_msg = f"WAV file not found: {wav_file}"
-            logging.error(f"❌ {error_msg}")
-            raise FileNotFoundError(error_msg)
-        
-        wav_size = os.path.getsize(wav_file)
-        logging.info(f"📊 WAV file size: {wav_size:,} bytes ({wav_size / (1024*1024):.2f} MB)")
-        
-        # Calculate estimated audio duration (16kHz mono, 16-bit)
-        bytes_per_second = 16000 * 2  # 16kHz * 2 bytes per sample
-        estimated_duration = wav_size / bytes_per_second
-        logging.info(f"⏱️  Estimated audio duration: {estimated_duration:.2f} seconds ({estimated_duration/60:.2f} minutes)")
-        
-        report_progress("transcribing", 55, "Loading Whisper model...")
-        
-        # Load Whisper model
-        model_name = config.get("whisper_model", "base")
-        device = config.get("device", "cpu")
-        
-        logging.info(f"🔧 Configuration:")
-        logging.info(f"   - Model: {model_name}")
-        logging.info(f"   - Device: {device}")
-        logging.info(f"⏳ Loading Whisper model (this may take a moment)...")
-        
-        # Check device availability
-        if device == "cuda":
-            if torch.cuda.is_available():
-                logging.info(f"🎮 CUDA available: {torch.cuda.get_device_name(0)}")
-                logging.info(f"💾 CUDA memory: {torch.cuda.get_device_properties(0).total_memory / 1024**3:.2f} GB")
-            else:
-                logging.warning("⚠️  CUDA requested but not available, falling back to CPU")
-                device = "cpu"
-        
-        if device == "cpu":
-            logging.info("💻 Using CPU for transcription")
-        
-        # Load model
-        model_load_start = datetime.now()
-        model = whisper.load_model(model_name, device=device)
-        model_load_time = (datetime.now() - model_load_start).total_seconds()
-        
-        logging.info(f"✅ Model loaded successfully in {model_load_time:.2f} seconds")
-        logging.info(f"📦 Model: {model_name}")
+        model = loaded["model"]
+        model_name = loaded["model_name"]
+        backend = loaded["backend"]
+        fp16 = loaded["fp16"]
         
         report_progress("transcribing", 65, f"Model loaded: {model_name}")
         
@@ -304,29 +602,19 @@ def transcribe_audio(wav_file: str, output_file: str, config: Dict[str, Any]) ->
         language = config.get("language", "English")
         original_language = language
         
-        # Map language to Whisper language codes
-        if language.lower() == "auto":
-            language = None  # Auto-detect
-        elif language.lower() == "english":
-            language = "en"  # Force English
-        elif language.lower() == "vietnamese":
-            language = "vi"  # Force Vietnamese
-        elif language.lower() == "chinese":
-            language = "zh"
-        elif language.lower() == "spanish":
-            language = "es"
-        elif language.lower() == "french":
-            language = "fr"
-        elif language.lower() == "german":
-            language = "de"
-        elif language.lower() == "japanese":
-            language = "ja"
-        elif language.lower() == "korean":
-            language = "ko"
-        # Add more languages as needed
+        # Map language to Whisper language codes ("auto" -> None = auto-detect).
+        # Names not in the table are passed through; Whisper accepts full language names too.
+        if CONFIG_MODULE_AVAILABLE:
+            language = get_language_code(language, language)
+        elif language.lower() == "auto":
+            language = None
+        
+        # faster-whisper only accepts ISO codes and raises on anything else; auto-detect instead
+        if backend == "faster-whisper" and language is not None and language not in model.supported_languages:
+            logging.warning(f"⚠️  Language '{original_language}' not supported by faster-whisper, using auto-detect")
+            language = None
         
         task = config.get("task", "transcribe")  # transcribe or translate
-        fp16 = config.get("fp16", False) and device == "cuda"
         
         logging.info(f"🔧 Transcription settings:")
         logging.info(f"   - Language: {original_language} (code={language if language else 'auto-detect'})")
@@ -337,39 +625,33 @@ def transcribe_audio(wav_file: str, output_file: str, config: Dict[str, Any]) ->
         
         # Transcribe
         logging.info("🚀 Starting Whisper transcription...")
-        start_time = datetime.now()
-        
-        # Start a thread to report estimated progress during transcription
-        import threading
-        stop_progress = threading.Event()
-        
-        def report_transcription_progress():
-            """Report estimated progress during transcription"""
-            progress = 70
-            while not stop_progress.is_set() and progress < 89:
-                stop_progress.wait(5)  # Wait 5 seconds between updates
-                if not stop_progress.is_set():
-                    progress = min(89, progress + 3)  # Increment by 3% every 5 seconds
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    report_progress("transcribing", progress, f"Transcribing audio... ({elapsed:.0f}s elapsed)")
-        
-        progress_thread = threading.Thread(target=report_transcription_progress, daemon=True)
-        progress_thread.start()
-        
-        try:
-            result = model.transcribe(
-                wav_file,
-                language=language,
-                task=task,
-                fp16=fp16,
-                verbose=False
-            )
-        finally:
-            # Stop progress reporting thread
-            stop_progress.set()
-            progress_thread.join(timeout=1)
-        
-        duration = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        
+        # Progress comes from the backend itself: faster-whisper's segment iterator,
+        # or openai-whisper's internal frame counter (see whisper_progress_hook)
+        if backend == "faster-whisper":
+            # Long audio goes through the batched pipeline; short clips have too few windows to batch
+            batch_size = config.get("batch_size", 8) if estimated_duration >= BATCHED_MIN_DURATION else None
+            result = transcribe_faster_whisper(model, audio, language, task, config.get("beam_size", 1), batch_size)
+        elif backend == "onnx":
+            result = transcribe_onnx(model, audio, language, task)
+        else:
+            import torch
+            if loaded["device"] == "cpu":
+                configure_torch_threads(physical_cpu_count())
+            # No autograd bookkeeping (version counters, view tracking) for inference-only tensors;
+            # DirectML gets plain no_grad since not all of its ops accept inference tensors
+            grad_mode = torch.no_grad() if loaded["device"] == "directml" else torch.inference_mode()
+            with grad_mode, whisper_progress_hook():
+                result = model.transcribe(
+                    audio,
+                    language=language,
+                    task=task,
+                    fp16=fp16,
+                    verbose=False
+                )
+        
+        duration = time.perf_counter() - start_time
         
         logging.info(f"✅ Transcription completed in {duration:.2f} seconds")
         
@@ -438,6 +720,430 @@ def transcribe_audio(wav_file: str, output_file: str, config: Dict[str, Any]) ->
         return False
 
 
+def preload_model(config: Dict[str, Any]) -> Future:
+    """
+    Start prepare_model(config) on a background thread and return its Future.
+    The thread is a daemon: a job that fails before it needs the model exits right away
+    instead of waiting at interpreter shutdown for a load or download nobody will use.
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            with _model_load_lock:
+                loaded = prepare_model(config)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(loaded)
+    
+    threading.Thread(target=run, name="model-loader", daemon=True).start()
+    return future
+
+
+def prepare_model(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve device and backend, import the backend and load the model.
+    Runs on the model-loader thread while FFmpeg extracts the audio, so it only logs (no progress reports).
+    Returns: dict with model, model_name, backend, device, fp16; raises ImportError if the backend is missing
+    """
+    # Check device availability ("auto" picks the best available accelerator)
+    model_name = config.get("whisper_model", "base")
+    device = resolve_device(config.get("device", "cpu"))
+    backend = select_backend(config.get("backend", "faster-whisper"), device)
+    
+    # Size OpenMP/MKL pools to physical cores before the backend import initializes them
+    if device == "cpu":
+        os.environ.setdefault("OMP_NUM_THREADS", str(physical_cpu_count()))
+        os.environ.setdefault("MKL_NUM_THREADS", str(physical_cpu_count()))
+    
+    # Import Whisper
+    if backend == "faster-whisper":
+        import faster_whisper
+        logging.info("✅ faster-whisper imported successfully")
+        logging.debug(f"🔍 faster-whisper version: {getattr(faster_whisper, '__version__', 'unknown')}")
+    elif backend == "onnx":
+        import onnxruntime
+        logging.info("✅ ONNX Runtime imported successfully")
+        logging.debug(f"🔍 ONNX Runtime version: {onnxruntime.__version__}")
+    else:
+        import whisper
+        import torch
+        logging.info("✅ Whisper and Torch imported successfully")
+        logging.debug(f"🔍 Whisper version: {whisper.__version__ if hasattr(whisper, '__version__') else 'unknown'}")
+        logging.debug(f"🔍 PyTorch version: {torch.__version__}")
+    
+    # Load Whisper model
+    fp16 = resolve_fp16(config.get("fp16"), device)
+    if backend == "faster-whisper":
+        compute_type = faster_whisper_compute_type(device, fp16)
+    elif backend == "openai-whisper" and device == "cpu" and config.get("quantize", True):
+        compute_type = "int8"  # dynamic int8 quantization, see quantize_whisper_model
+    else:
+        compute_type = None
+    
+    logging.info(f"🔧 Configuration:")
+    logging.info(f"   - Model: {model_name}")
+    logging.info(f"   - Device: {device}")
+    logging.info(f"   - Backend: {backend}" + (f" ({compute_type})" if compute_type else ""))
+    logging.info(f"⏳ Loading Whisper model (this may take a moment)...")
+    
+    if device == "cuda":
+        import torch
+        logging.info(f"🎮 CUDA available: {torch.cuda.get_device_name(0)}")
+        logging.info(f"💾 CUDA memory: {torch.cuda.get_device_properties(0).total_memory / 1024**3:.2f} GB")
+        
+        # Let remaining FP32 matmuls/convolutions use TF32 tensor cores (Ampere and newer)
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.set_float32_matmul_precision("high")
+    elif device == "cpu":
+        logging.info("💻 Using CPU for transcription")
+    else:
+        logging.info(f"🎮 Using {device.upper()} for transcription")
+    
+    # Load model (cached across jobs when running in --stdin-mode)
+    model_load_start = time.perf_counter()
+    model_source = onnx_model_dir(config) if backend == "onnx" else model_name
+    model = load_whisper_model(model_source, device, backend, compute_type)
+    model_load_time = time.perf_counter() - model_load_start
+    
+    logging.info(f"✅ Model loaded successfully in {model_load_time:.2f} seconds")
+    logging.info(f"📦 Model: {model_name}")
+    
+    return {"model": model, "model_name": model_name, "backend": backend, "device": device, "fp16": fp16}
+
+
+def load_whisper_model(model_name: str, device: str, backend: str = "openai-whisper", compute_type: Optional[str] = None):
+    """Load a Whisper model, reusing the instance from a previous job if available"""
+    key = (backend, model_name, device, compute_type)
+    model = _model_cache.get(key)
+    if model is not None:
+        logging.info(f"♻️  Reusing cached Whisper model: {model_name} ({device}, {backend})")
+        return model
+    
+    if backend == "faster-whisper":
+        from faster_whisper import WhisperModel
+        model = WhisperModel(model_name, device=device, compute_type=compute_type,
+                             cpu_threads=physical_cpu_count() if device == "cpu" else 0)
+    elif backend == "onnx":
+        model = load_onnx_model(model_name, device)
+    else:
+        import whisper
+        model = whisper.load_model(model_name, device=torch_device(device))
+        if compute_type == "int8":
+            model = quantize_whisper_model(model)
+    _model_cache[key] = model
+    return model
+
+
+def quantize_whisper_model(model):
+    """Dynamic int8 quantization of an openai-whisper model's Linear layers (CPU; fbgemm int8 GEMMs)"""
+    import torch
+    import whisper.model
+    
+    # whisper.model.Linear only adds a cast to the input dtype (for fp16), while quantize_dynamic
+    # matches exact module types - turn those layers back into plain nn.Linear first
+    for module in model.modules():
+        if type(module) is whisper.model.Linear:
+            module.__class__ = torch.nn.Linear
+    
+    torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    logging.info("✅ Applied dynamic int8 quantization")
+    return model
+
+
+# Optional backends: (module that must be installed, devices it can run on).
+# Anything else - or a missing module - uses openai-whisper.
+OPTIONAL_BACKENDS = {
+    "faster-whisper": ("faster_whisper", ("cpu", "cuda")),
+    "onnx": ("optimum.onnxruntime", ("cpu", "cuda")),
+}
+
+
+def module_installed(name: str) -> bool:
+    """Check that a (possibly dotted) module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+def select_backend(backend: str, device: str) -> str:
+    """Fall back to openai-whisper when an optional backend is not installed or does not support the device"""
+    if backend not in OPTIONAL_BACKENDS:
+        return backend
+    module, devices = OPTIONAL_BACKENDS[backend]
+    if device not in devices:
+        logging.info(f"ℹ️  {backend} does not support {device.upper()}, using openai-whisper")
+        return "openai-whisper"
+    if not module_installed(module):
+        logging.warning(f"⚠️  {backend} not installed, falling back to openai-whisper")
+        return "openai-whisper"
+    return backend
+
+
+@lru_cache(maxsize=None)
+def physical_cpu_count() -> int:
+    """Physical core count (SMT siblings share FP units and L1, so extra inference threads only contend)"""
+    try:
+        import psutil
+        count = psutil.cpu_count(logical=False)
+    except ImportError:
+        count = None
+    return count or os.cpu_count() or 1
+
+
+def configure_torch_threads(threads: int):
+    """Set PyTorch's intra-op threads (per calling thread, so call it where inference runs)"""
+    import torch
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Can only be set once, before any inter-op work (later jobs in --stdin-mode)
+
+
+def resolve_fp16(requested: Optional[bool], device: str) -> bool:
+    """
+    FP16 only on CUDA GPUs with tensor cores (compute capability 7.0+, Volta/Turing and newer).
+    There it is on unless the config explicitly sets fp16 to false; None (the default) means auto.
+    """
+    if device != "cuda":
+        return False
+    import torch
+    if torch.cuda.get_device_capability(0)[0] < 7:
+        return False
+    return True if requested is None else bool(requested)
+
+
+def faster_whisper_compute_type(device: str, fp16: bool) -> str:
+    """int8 weights everywhere; on CUDA with FP16 enabled, activations run in float16"""
+    return "int8_float16" if device == "cuda" and fp16 else "int8"
+
+
+class TranscriptionProgress:
+    """Maps a position in the audio (0..total, any unit) onto the transcribing progress range"""
+    
+    START_PERCENT = 70
+    END_PERCENT = 89
+    
+    def __init__(self, total: float):
+        self.total = total
+        self.percent = self.START_PERCENT
+    
+    def update(self, position: float):
+        """Report progress, but only when the whole percentage actually changes"""
+        if not self.total:
+            return
+        fraction = min(position / self.total, 1.0)
+        percent = self.START_PERCENT + int((self.END_PERCENT - self.START_PERCENT) * fraction)
+        if percent != self.percent:
+            self.percent = percent
+            report_progress("transcribing", percent, f"Transcribing audio... ({fraction:.0%})")
+
+
+@contextmanager
+def whisper_progress_hook():
+    """
+    Report openai-whisper's real progress: whisper.transcribe drives a tqdm bar over the
+    audio frames, so for the duration of the call its tqdm is swapped for a stand-in that
+    forwards the frame count to TranscriptionProgress.
+    """
+    module = sys.modules.get("whisper.transcribe")
+    if module is None or not hasattr(module, "tqdm"):
+        yield
+        return
+    
+    class FrameProgressBar:
+        def __init__(self, total=None, **kwargs):
+            self.n = 0
+            self.progress = TranscriptionProgress(total or 0)
+        
+        def update(self, n=1):
+            self.n += n
+            self.progress.update(self.n)
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc):
+            return False
+    
+    original = module.tqdm
+    module.tqdm = types.SimpleNamespace(tqdm=FrameProgressBar)
+    try:
+        yield
+    finally:
+        module.tqdm = original
+
+
+# Audio shorter than this (seconds) is transcribed without BatchedInferencePipeline
+BATCHED_MIN_DURATION = 60
+
+
+def transcribe_faster_whisper(model, audio, language: Optional[str], task: str, beam_size: int,
+                              batch_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run faster-whisper and return a result dict shaped like openai-whisper's (text, segments, language).
+    With batch_size > 1, BatchedInferencePipeline splits the audio into 30 s VAD-bounded windows and
+    runs them through the model batch_size at a time; timestamp tokens stay on, so segments are
+    sentence-level (like the sequential path) with absolute timestamps.
+    """
+    if batch_size and batch_size > 1:
+        from faster_whisper import BatchedInferencePipeline
+        logging.info(f"📦 Batched transcription (batch size {batch_size})")
+        segments_iter, info = BatchedInferencePipeline(model=model).transcribe(
+            audio,
+            language=language,
+            task=task,
+            beam_size=beam_size,
+            batch_size=batch_size,
+            chunk_length=30,
+            vad_filter=True,
+            # Defaults to True in the batched pipeline, which makes each ~30 s chunk a single cue
+            without_timestamps=False
+        )
+    else:
+        segments_iter, info = model.transcribe(
+            audio,
+            language=language,
+            task=task,
+            beam_size=beam_size,
+            vad_filter=True
+        )
+    
+    # Segments are generated lazily; decoding happens while this list is built
+    progress = TranscriptionProgress(info.duration)
+    segments = []
+    for seg in segments_iter:
+        segments.append({"id": seg.id, "start": seg.start, "end": seg.end, "text": seg.text})
+        progress.update(seg.end)
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": info.language
+    }
+
+
+def onnx_model_dir(config: Dict[str, Any]) -> str:
+    """Directory of the exported + int8-quantized ONNX model (default: models/whisper-<size>-onnx)"""
+    return config.get("onnx_model_dir") or os.path.join(
+        SCRIPT_DIR, "models", f"whisper-{config.get('whisper_model', 'base')}-onnx")
+
+
+def load_onnx_model(model_dir: str, device: str):
+    """Load a pre-exported ONNX Whisper model (see README) as a transformers speech-recognition pipeline"""
+    if not os.path.isdir(model_dir):
+        raise FileNotFoundError(f"ONNX model directory not found: {model_dir} (see README: ONNX backend)")
+    
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    from transformers import AutoProcessor, pipeline
+    
+    session_options = ort.SessionOptions()
+    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    session_options.intra_op_num_threads = physical_cpu_count()
+    provider = "CUDAExecutionProvider" if device == "cuda" else "CPUExecutionProvider"
+    
+    model = ORTModelForSpeechSeq2Seq.from_pretrained(model_dir, session_options=session_options, provider=provider)
+    processor = AutoProcessor.from_pretrained(model_dir)
+    return pipeline(
+        "automatic-speech-recognition",
+        model=model,
+        tokenizer=processor.tokenizer,
+        feature_extractor=processor.feature_extractor,
+        chunk_length_s=30
+    )
+
+
+def read_wav_samples(wav_file: str):
+    """Read a 16-bit PCM WAV as float32 samples in [-1, 1]"""
+    import wave
+    import numpy as np
+    with wave.open(wav_file, "rb") as w:
+        frames = w.readframes(w.getnframes())
+    return np.frombuffer(frames, np.int16).astype(np.float32) / 32768.0
+
+
+def transcribe_onnx(pipe, audio, language: Optional[str], task: str) -> Dict[str, Any]:
+    """Run the ONNX pipeline and return a result dict shaped like openai-whisper's (text, segments, language)"""
+    if isinstance(audio, str):
+        audio = read_wav_samples(audio)
+    generate_kwargs = {"task": task}
+    if language:
+        generate_kwargs["language"] = language
+    
+    output = pipe({"raw": audio, "sampling_rate": 16000}, return_timestamps=True, generate_kwargs=generate_kwargs)
+    
+    # The last chunk can have an open end timestamp; close it at the end of the audio
+    duration = len(audio) / 16000
+    segments = []
+    for i, chunk in enumerate(output.get("chunks", [])):
+        start, end = chunk["timestamp"]
+        segments.append({
+            "id": i,
+            "start": start or 0.0,
+            "end": end if end is not None else duration,
+            "text": chunk["text"]
+        })
+    return {
+        "text": output["text"],
+        "segments": segments,
+        "language": language or "unknown"
+    }
+
+
+# Accelerators tried, in order, when device is "auto"
+AUTO_DEVICE_ORDER = ("cuda", "xpu", "directml", "mps")
+
+
+@lru_cache(maxsize=None)
+def device_available(device: str) -> bool:
+    """Probe whether a device backend is usable (cached - probes are not free)"""
+    if device == "cpu":
+        return True
+    try:
+        import torch
+        if device == "cuda":
+            return torch.cuda.is_available()
+        if device == "xpu":
+            return hasattr(torch, "xpu") and torch.xpu.is_available()
+        if device == "mps":
+            return torch.backends.mps.is_available()
+        if device == "directml":
+            import torch_directml
+            return torch_directml.is_available()
+    except Exception as e:
+        logging.debug(f"🔍 {device} probe failed: {e}")
+    return False
+
+
+def resolve_device(device: str) -> str:
+    """Resolve "auto" to the best available device, falling back to CPU when unavailable"""
+    if device == "auto":
+        for candidate in AUTO_DEVICE_ORDER:
+            if device_available(candidate):
+                logging.info(f"🔍 Auto-selected device: {candidate}")
+                return candidate
+        return "cpu"
+    
+    if not device_available(device):
+        logging.warning(f"⚠️  {device.upper()} requested but not available, falling back to CPU")
+        return "cpu"
+    return device
+
+
+def torch_device(device: str):
+    """Map a device name to what torch expects (DirectML uses its own device object)"""
+    if device == "directml":
+        import torch_directml
+        return torch_directml.device()
+    return device
+
+
 def save_subtitle(result: Dict[str, Any], output_file: str, format: str):
     """Save transcription result in specified format"""
     try:
@@ -464,18 +1170,31 @@ def save_subtitle(result: Dict[str, Any], output_file: str, format: str):
         raise
 
 
+def write_file_bytes(output_file: str, data: bytes):
+    """
+    Write an already-encoded file with raw os.write calls (no TextIOWrapper).
+    Newlines become os.linesep like text mode, so Windows output keeps its CRLF line endings.
+    """
+    if os.linesep != "\n":
+        data = data.replace(b"\n", os.linesep.encode("ascii"))
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def save_srt(segments: list, output_file: str):
     """Save as SRT format"""
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            for i, segment in enumerate(segments, start=1):
-                start = format_timestamp(segment["start"])
-                end = format_timestamp(segment["end"])
-                text = segment["text"].strip()
-                
-                f.write(f"{i}\n")
-                f.write(f"{start} --> {end}\n")
-                f.write(f"{text}\n\n")
+        # Build the whole file in memory, encode it once and write it with a single call
+        parts = [
+            f"{i}\n{format_timestamp(segment['start'])} --> {format_timestamp(segment['end'])}\n{segment['text'].strip()}\n\n"
+            for i, segment in enumerate(segments, start=1)
+        ]
+        write_file_bytes(output_file, "".join(parts).encode("utf-8"))
         
         logging.debug(f"Saved {len(segments)} segments to SRT file")
     except Exception as e:
@@ -486,16 +1205,13 @@ def save_srt(segments: list, output_file: str):
 def save_vtt(segments: list, output_file: str):
     """Save as WebVTT format"""
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("WEBVTT\n\n")
-            
-            for segment in segments:
-                start = format_timestamp(segment["start"], vtt=True)
-                end = format_timestamp(segment["end"], vtt=True)
-                text = segment["text"].strip()
-                
-                f.write(f"{start} --> {end}\n")
-                f.write(f"{text}\n\n")
+        # Build the whole file in memory, encode it once and write it with a single call
+        parts = ["WEBVTT\n\n"]
+        parts.extend(
+            f"{format_timestamp(segment['start'], vtt=True)} --> {format_timestamp(segment['end'], vtt=True)}\n{segment['text'].strip()}\n\n"
+            for segment in segments
+        )
+        write_file_bytes(output_file, "".join(parts).encode("utf-8"))
         
         logging.debug(f"Saved {len(segments)} segments to VTT file")
     except Exception as e:
@@ -506,8 +1222,7 @@ def save_vtt(segments: list, output_file: str):
 def save_txt(text: str, output_file: str):
     """Save as plain text"""
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(text.strip())
+        write_file_bytes(output_file, text.strip().encode("utf-8"))
         
         logging.debug(f"Saved text transcript ({len(text)} chars)")
     except Exception as e:
@@ -518,8 +1233,7 @@ def save_txt(text: str, output_file: str):
 def save_json(result: Dict[str, Any], output_file: str):
     """Save full result as JSON"""
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        write_file_bytes(output_file, dumps_json_pretty(result))
         
         logging.debug(f"Saved full JSON result")
     except Exception as e:
@@ -528,21 +1242,16 @@ def save_json(result: Dict[str, Any], output_file: str):
 
 
 def format_timestamp(seconds: float, vtt: bool = False) -> str:
-    """Format timestamp for SRT/VTT"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    
-    if vtt:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
-    else:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    """Format timestamp for SRT/VTT (integer milliseconds split with divmod, no float modulo)"""
+    hours, millis = divmod(round(seconds * 1000), 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{'.' if vtt else ','}{millis:03d}"
 
 
 def process_media_file(config: Dict[str, Any]) -> bool:
     """Main processing function"""
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
         logging.info("=" * 70)
@@ -585,7 +1294,8 @@ def process_media_file(config: Dict[str, Any]) -> bool:
         logging.info(f"📄 Output format: {config.get('output_format', 'srt')}")
         logging.info(f"🔧 Task: {config.get('task', 'transcribe')}")
         logging.info("-" * 70)
-        logging.debug(f"Full configuration: {json.dumps(config, indent=2)}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Full configuration: {json.dumps(config, indent=2)}")
         
         # Create output directory
         logging.info("")
@@ -593,23 +1303,32 @@ def process_media_file(config: Dict[str, Any]) -> bool:
         os.makedirs(output_dir, exist_ok=True)
         logging.info(f"✅ Output directory ready: {output_dir}")
         
-        # Generate output filenames
+        # Generate output filenames (the WAV is only written when keep_wav is set;
+        # otherwise FFmpeg's PCM output is streamed straight into memory)
         base_name = Path(input_file).stem
-        wav_file = os.path.join(output_dir, f"{base_name}.wav")
+        wav_file = os.path.join(output_dir, f"{base_name}.wav") if config.get("keep_wav", False) else None
         
         output_format = config.get("output_format", "srt")
         subtitle_file = os.path.join(output_dir, f"{base_name}.{output_format}")
         
         logging.info("")
         logging.info("📝 OUTPUT FILES")
-        logging.info(f"   🔊 WAV: {wav_file}")
+        logging.info(f"   🔊 WAV: {wav_file or '(not written, audio kept in memory)'}")
         logging.info(f"   📄 Subtitle: {subtitle_file}")
         
         report_progress("queued", 0, f"Processing: {Path(input_file).name}")
         
+        # Load the model while FFmpeg extracts the audio (the two are independent). The backend
+        # imports (torch/whisper, faster_whisper or onnxruntime) happen in prepare_model as well,
+        # so their startup cost overlaps the extraction instead of following it. When the input or
+        # FFmpeg is missing, extraction is about to fail: skip the (possibly large) model download.
+        ffmpeg_path = config.get("ffmpeg_path", "ffmpeg")
+        model_future = preload_model(config) if extraction_possible(input_file, ffmpeg_path) else None
+        
         # Step 1: Extract audio
         logging.info("")
-        if not extract_audio(input_file, wav_file, config.get("ffmpeg_path", "ffmpeg")):
+        audio = extract_audio(input_file, wav_file, ffmpeg_path)
+        if audio is None:
             error_msg = "Audio extraction failed"
             logging.error(f"❌ {error_msg}")
             report_result(False, error=error_msg)
@@ -617,14 +1336,14 @@ def process_media_file(config: Dict[str, Any]) -> bool:
         
         # Step 2: Transcribe audio
         logging.info("")
-        if not transcribe_audio(wav_file, subtitle_file, config):
+        if not transcribe_audio(audio, subtitle_file, config, model_future):
             error_msg = "Transcription failed"
             logging.error(f"❌ {error_msg}")
             report_result(False, wav_file=wav_file, error=error_msg)
             return False
         
         # Success
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         
         logging.info("")
         logging.info("=" * 70)
@@ -635,7 +1354,7 @@ def process_media_file(config: Dict[str, Any]) -> bool:
         
         # Get file sizes
         input_size = os.path.getsize(input_file)
-        wav_size = os.path.getsize(wav_file)
+        wav_size = os.path.getsize(wav_file) if wav_file else 0
         subtitle_size = os.path.getsize(subtitle_file)
         
         metadata = {
@@ -692,16 +1411,61 @@ def process_media_file(config: Dict[str, Any]) -> bool:
         report_result(False, error=error_msg)
         return False
     finally:
-        duration = (datetime.now() - start_time).total_seconds()
+        close_progress_writer()
+        duration = time.perf_counter() - start_time
         logging.info("")
         logging.info(f"⏱️  Total execution time: {duration:.2f} seconds ({duration/60:.2f} minutes)")
         logging.info(f"📅 Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 
+def run_stdin_mode() -> int:
+    """
+    Process newline-delimited JSON job configs from stdin until EOF.
+    The process (and any loaded Whisper model) stays alive between jobs;
+    each job reports exactly one {"result": ...} line on stdout.
+    A {"ready": true} line is written at startup and after every job, when the worker is idle.
+    Returns: exit code (0 if every job succeeded)
+    """
+    global job_id
+    failed_jobs = 0
+    
+    logging.info("📥 Stdin mode: waiting for job configurations (one JSON object per line)...")
+    emit_json({"ready": True})
+    
+    for line in sys.stdin.buffer:
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            config = loads_json(line)
+            job_id = config.get('job_id') or new_job_id()
+            logging.info(f"🆔 Job ID: {job_id}")
+        except Exception as e:
+            error_msg = f"Failed to decode configuration: {str(e)}"
+            logging.error(f"❌ {error_msg}")
+            report_result(False, error=error_msg)
+            failed_jobs += 1
+            emit_json({"ready": True})
+            continue
+        
+        if not process_media_file(config):
+            failed_jobs += 1
+        emit_json({"ready": True})
+    
+    logging.info(f"📭 Stdin closed, worker exiting ({failed_jobs} failed job(s))")
+    return 0 if failed_jobs == 0 else 1
+
+
 def main():
     """Entry point"""
     parser = argparse.ArgumentParser(description="Process media file for subtitle generation")
-    parser.add_argument("--config", required=True, help="Base64 encoded JSON configuration")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--config", help="Base64 encoded JSON configuration")
+    source.add_argument("--config-stdin", action="store_true",
+                        help="Read a single JSON configuration from stdin")
+    source.add_argument("--stdin-mode", "--server", action="store_true",
+                        help="Keep running and read one JSON configuration per line from stdin")
     parser.add_argument("--log-dir", default="logs", help="Directory for log files")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--debug", action="store_true", help="Wait for debugger to attach")
@@ -737,17 +1501,23 @@ def main():
         logging.info(f"📅 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logging.info("=" * 70)
         
+        if args.stdin_mode:
+            sys.exit(run_stdin_mode())
+        
         # Decode configuration
         try:
             logging.info("🔓 Decoding configuration...")
-            config_json = base64.b64decode(args.config).decode("utf-8")
-            config = json.loads(config_json)
+            # Both paths parse bytes directly; no intermediate str copy of the JSON
+            if args.config_stdin:
+                config = loads_json(sys.stdin.buffer.read())
+            else:
+                config = loads_json(base64.b64decode(args.config))
             logging.info("✅ Configuration decoded successfully")
             logging.debug(f"📋 Configuration keys: {list(config.keys())}")
             
             # Set global job_id for progress reporting
             global job_id
-            job_id = config.get('job_id', str(uuid.uuid4()))
+            job_id = config.get('job_id') or new_job_id()
             logging.info(f"🆔 Job ID: {job_id}")
             
         except Exception as e:
@@ -6,15 +6,16 @@ Test script to verify progress file creation
 import sys
 import os
 import json
-import base64
-import uuid
-from datetime import datetime
+import time
+import traceback
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
+from process_media import ProgressWriter, read_small_json, new_job_id, dumps_json
+
 # Test configuration
-test_job_id = str(uuid.uuid4())
+test_job_id = new_job_id()
 print(f"Test Job ID: {test_job_id}")
 
 config = {
@@ -30,11 +31,10 @@ config = {
     "output_format": "srt"
 }
 
-# Encode config
+# Config is sent as raw JSON on stdin (process_media.py --config-stdin)
 config_json = json.dumps(config)
-config_base64 = base64.b64encode(config_json.encode()).decode()
 
-print(f"\nConfig (Base64): {config_base64[:50]}...")
+print(f"\nConfig (stdin JSON): {config_json[:50]}...")
 print(f"\nExpected progress file location:")
 
 # Simulate what process_media.py does
@@ -47,18 +47,24 @@ progress = {
     "phase": "testing",
     "percent": 50,
     "message": "Test progress",
-    "timestamp": datetime.now().isoformat()
+    "timestamp": int(time.time() * 1000)  # Unix epoch milliseconds
 }
 
 try:
-    with open(progress_file, 'w', encoding='utf-8') as f:
-        json.dump(progress, f, ensure_ascii=False, indent=2)
+    writer = ProgressWriter(progress_file)
+    writer.write(progress)
     print(f"\n✅ Successfully created progress file")
     print(f"   File exists: {os.path.exists(progress_file)}")
     
+    # A repeated update with the same phase/percent right away is throttled
+    print(f"   Duplicate update throttled: {not writer.write(progress)}")
+    
+    # A phase change is published immediately, replacing the previous snapshot
+    writer.write({"phase": "done", "percent": 100, "message": ""})
+    writer.close()
+    
     # Read it back
-    with open(progress_file, 'r', encoding='utf-8') as f:
-        read_back = json.load(f)
+    read_back = read_small_json(progress_file)
     print(f"   Content verified: {read_back}")
     
     # Clean up
@@ -67,5 +73,7 @@ try:
     
 except Exception as e:
     print(f"\n❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+    # Report as one pre-formatted JSON line on stderr so callers can parse it
+    error = {"status": "error", "error": str(e), "trace": traceback.format_exc()}
+    sys.stderr.buffer.write(dumps_json(error) + b"\n")
+    sys.stderr.buffer.flush()
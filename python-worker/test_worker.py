@@ -4,28 +4,185 @@ Test script for process_media.py
 Creates a test configuration and runs the worker
 """
 
+import codecs
 import json
-import base64
 import subprocess
 import sys
 import os
-from pathlib import Path
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from config import MODEL_VRAM_BYTES
+
+# Only the tail of the worker's stderr log is kept in memory
+STDERR_TAIL_LINES = 200
+
+# Worker pipes are read as bytes and decoded in chunks of this size
+PIPE_CHUNK_BYTES = 64 * 1024
+
+# Test configuration
+TEST_CONFIG = {
+    "input_file": "C:\\Videos\\test.mp4",  # Change to your test file
+    "output_dir": "C:\\Output\\test",
+    "ffmpeg_path": "ffmpeg",
+    "whisper_model": "tiny",  # Use smallest model for testing
+    "language": "English",
+    "device": "cpu",
+    "fp16": False,
+    "task": "transcribe",
+    "output_format": "srt"
+}
+
+def drain_stream(stream, buffer):
+    """Read a binary pipe in large chunks, decode each chunk once and keep its lines in a bounded buffer until EOF"""
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    pending = ""
+    while True:
+        chunk = stream.read1(PIPE_CHUNK_BYTES)
+        lines = (pending + decoder.decode(chunk, final=not chunk)).splitlines(keepends=True)
+        pending = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+        buffer.extend(lines)
+        if not chunk:
+            break
+    if pending:
+        buffer.append(pending)
+
+def start_worker():
+    """
+    Start a long-lived worker that loads the model once and reads jobs from stdin.
+    Returns: (process, stderr_tail, stderr_thread)
+    """
+    cmd = [sys.executable, "process_media.py", "--stdin-mode"]
+    worker = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    
+    # Drain stderr in the background so a chatty log can never fill the pipe and block the worker
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+    stderr_thread = threading.Thread(target=drain_stream, args=(worker.stderr, stderr_tail), daemon=True)
+    stderr_thread.start()
+    
+    # Wait for the worker's startup handshake (or EOF if it died on startup)
+    for line in worker.stdout:
+        if line.startswith(b'{"ready":'):
+            break
+    
+    return worker, stderr_tail, stderr_thread
+
+def run_job(worker, config, echo=True):
+    """Send one job to the worker and wait for its result line"""
+    worker.stdin.write(json.dumps(config).encode('utf-8') + b"\n")
+    worker.stdin.flush()
+    
+    if echo:
+        print("STDOUT:")
+        print("-" * 50)
+    # Lines stay bytes; they are only decoded when echoed (json.loads takes bytes directly)
+    for line in worker.stdout:
+        if line.startswith(b'{"ready":'):
+            continue
+        if echo:
+            print(line.decode('utf-8', 'replace'), end="")
+        if line.startswith(b'{"result":'):
+            if echo:
+                print()
+            return json.loads(line)["result"]
+    
+    return None
+
+def free_vram_bytes():
+    """
+    Free VRAM on the current CUDA device, queried in a short-lived subprocess: a CUDA context
+    created here would hold on to VRAM meant for the workers until the harness exits
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", "import torch; print(torch.cuda.mem_get_info()[0])"],
+        capture_output=True, timeout=120
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode('utf-8', 'replace'))
+    return int(result.stdout)
+
+def gpu_worker_limit(configs):
+    """How many GPU workers fit in free VRAM, sized for the largest model in the batch"""
+    try:
+        free_bytes = free_vram_bytes()
+    except Exception:
+        return 1
+    
+    largest = max(MODEL_VRAM_BYTES.values())
+    per_worker = max(MODEL_VRAM_BYTES.get(c.get("whisper_model", "base"), largest) for c in configs)
+    return max(1, free_bytes // per_worker)
+
+def cpu_worker_limit():
+    """CPU workers for a batch: half the logical cores (each worker is multi-threaded itself)"""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+class WorkerPool:
+    """
+    Thread pool where each thread drives its own long-lived worker process.
+    The work happens in the worker processes; threads only feed their stdin/stdout,
+    and each worker keeps its model loaded across the jobs it receives.
+    """
+    
+    def __init__(self, max_workers):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._local = threading.local()
+        self._workers = []
+        self._lock = threading.Lock()
+    
+    def submit(self, config):
+        return self._executor.submit(self._run, config)
+    
+    def _run(self, config):
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            worker = self._local.worker = start_worker()
+            with self._lock:
+                self._workers.append(worker)
+        return run_job(worker[0], config, echo=False)
+    
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for process, _, stderr_thread in self._workers:
+            process.stdin.close()
+            process.wait()
+            stderr_thread.join()
+
+def run_batch(configs, max_workers=None):
+    """
+    Run a batch of jobs in parallel: GPU jobs bounded by free VRAM, CPU jobs by cpu_worker_limit().
+    Returns: list of result dicts in input order (None if a worker exited without a result)
+    """
+    # Jobs are tracked by list index (the same config object may appear more than once)
+    gpu_jobs = [(i, c) for i, c in enumerate(configs) if c.get("device", "cpu") != "cpu"]
+    cpu_jobs = [(i, c) for i, c in enumerate(configs) if c.get("device", "cpu") == "cpu"]
+    
+    pools = []
+    futures = {}
+    try:
+        if gpu_jobs:
+            pools.append(WorkerPool(max_workers or gpu_worker_limit([c for _, c in gpu_jobs])))
+            for i, c in gpu_jobs:
+                futures[i] = pools[-1].submit(c)
+        if cpu_jobs:
+            pools.append(WorkerPool(max_workers or cpu_worker_limit()))
+            for i, c in cpu_jobs:
+                futures[i] = pools[-1].submit(c)
+        
+        return [futures[i].result() for i in range(len(configs))]
+    finally:
+        for pool in pools:
+            pool.close()
 
 def test_worker():
     """Test the worker with a sample configuration"""
     
-    # Test configuration
-    config = {
-        "input_file": "C:\\Videos\\test.mp4",  # Change to your test file
-        "output_dir": "C:\\Output\\test",
-        "ffmpeg_path": "ffmpeg",
-        "whisper_model": "tiny",  # Use smallest model for testing
-        "language": "English",
-        "device": "cpu",
-        "fp16": False,
-        "task": "transcribe",
-        "output_format": "srt"
-    }
+    config = dict(TEST_CONFIG)
     
     print("=" * 50)
     print("Testing Python Worker")
@@ -43,48 +200,64 @@ def test_worker():
     print(f"Model: {config['whisper_model']}")
     print()
     
-    # Encode configuration
-    config_json = json.dumps(config)
-    config_base64 = base64.b64encode(config_json.encode()).decode()
-    
-    # Run worker
-    cmd = [sys.executable, "process_media.py", "--config", config_base64]
-    
     print("Running worker...")
     print()
     
     try:
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        
-        print("STDOUT:")
-        print("-" * 50)
-        print(result.stdout)
-        print()
+        worker, stderr_tail, stderr_thread = start_worker()
+        try:
+            result = run_job(worker, config)
+        finally:
+            # Closing stdin tells the worker there are no more jobs
+            worker.stdin.close()
+            worker.wait()
+            stderr_thread.join()
         
-        if result.stderr:
-            print("STDERR:")
+        if stderr_tail:
+            print(f"STDERR (last {len(stderr_tail)} lines):")
             print("-" * 50)
-            print(result.stderr)
-            print()
+            print("".join(stderr_tail))
         
-        if result.returncode == 0:
+        if result is None:
+            print(f"[ERROR] Worker exited without a result (exit code: {worker.returncode})")
+            return False
+        
+        if result.get("success"):
             print("[SUCCESS] Worker completed successfully!")
+            print(f"Subtitle file: {result.get('subtitle_file')}")
             return True
         else:
-            print(f"[ERROR] Worker failed with exit code: {result.returncode}")
+            print(f"[ERROR] Worker failed: {result.get('error')}")
             return False
             
     except Exception as e:
         print(f"[ERROR] Failed to run worker: {e}")
         return False
 
+def run_test_batch(input_files):
+    """Run TEST_CONFIG against several input files in parallel"""
+    configs = [dict(TEST_CONFIG, input_file=f) for f in input_files]
+    
+    print("=" * 50)
+    print(f"Testing Python Worker - batch of {len(configs)} file(s)")
+    print("=" * 50)
+    print()
+    
+    results = run_batch(configs)
+    for config, result in zip(configs, results):
+        if result is None:
+            print(f"[ERROR] {config['input_file']}: worker exited without a result")
+        elif result.get("success"):
+            print(f"[SUCCESS] {config['input_file']} -> {result.get('subtitle_file')}")
+        else:
+            print(f"[ERROR] {config['input_file']}: {result.get('error')}")
+    
+    return all(r is not None and r.get("success") for r in results)
+
 if __name__ == "__main__":
-    success = test_worker()
+    if len(sys.argv) > 1:
+        # python test_worker.py video1.mp4 video2.mp4 ...
+        success = run_test_batch(sys.argv[1:])
+    else:
+        success = test_worker()
     sys.exit(0 if success else 1)
@@ -16,14 +16,15 @@ public class WhisperSettings
     public string Language { get; set; } = "English";
     
     /// <summary>
-    /// Processing device (cpu or cuda)
+    /// Processing device (cpu, cuda, mps, xpu, directml or auto)
     /// </summary>
     public string Device { get; set; } = "cpu";
     
     /// <summary>
-    /// Enable FP16 precision (GPU only)
+    /// Enable FP16 precision (GPU only). Null lets the worker decide: on for CUDA GPUs
+    /// with tensor cores (compute capability 7.0+), off everywhere else
     /// </summary>
-    public bool Fp16 { get; set; } = false;
+    public bool? Fp16 { get; set; }
     
     /// <summary>
     /// Task type (transcribe or translate)
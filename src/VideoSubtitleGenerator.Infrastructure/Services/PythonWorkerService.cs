@@ -1,6 +1,7 @@
 using System.Diagnostics;
 using System.Text;
 using System.Text.Json;
+using System.Text.Json.Serialization;
 using VideoSubtitleGenerator.Core;
 using VideoSubtitleGenerator.Core.Enums;
 using VideoSubtitleGenerator.Core.Interfaces;
@@ -42,8 +43,9 @@ public class PythonWorkerService : IPythonWorkerService
             _logService.LogInfo("============================================================");
             _logService.LogInfo($"Starting processing: {Path.GetFileName(job.InputFilePath)}");
 
-            // Prepare arguments
-            var args = BuildPythonArguments(job);
+            // Prepare arguments (configuration is sent over stdin)
+            var args = BuildPythonArguments();
+            var configJson = BuildConfigJson(job);
 
             // Start Python process
             var processStartInfo = new ProcessStartInfo
@@ -51,8 +53,11 @@ public class PythonWorkerService : IPythonWorkerService
                 FileName = _settings.Python.PythonExePath,
                 Arguments = $"-u {args}",  // -u flag for unbuffered output
                 UseShellExecute = false,
+                RedirectStandardInput = true,
                 RedirectStandardOutput = true,
                 RedirectStandardError = true,
+                StandardInputEncoding = new UTF8Encoding(false),
+                StandardOutputEncoding = Encoding.UTF8,  // worker writes JSON lines as raw UTF-8
                 CreateNoWindow = true
             };
 
@@ -152,6 +157,10 @@ public class PythonWorkerService : IPythonWorkerService
             process.BeginOutputReadLine();
             process.BeginErrorReadLine();
 
+            // Send configuration as raw JSON on stdin (no command-line length limit, no Base64 round-trip)
+            await process.StandardInput.WriteAsync(configJson);
+            process.StandardInput.Close();
+
             // Set up log monitoring thread for Whisper progress (from stderr)
             var logMonitorCts = new CancellationTokenSource();
             var logDir = Path.GetDirectoryName(_settings.Logging?.LogFilePath ?? "logs\\app.log");
@@ -185,7 +194,11 @@ public class PythonWorkerService : IPythonWorkerService
                 {
                     if (File.Exists(progressFile))
                     {
-                        var json = File.ReadAllText(progressFile);
+                        // Python publishes each snapshot with a rename over this file; FileShare.Delete lets that
+                        // replace succeed while we are reading, and we always see a complete document
+                        using var fs = new FileStream(progressFile, FileMode.Open, FileAccess.Read, FileShare.Read | FileShare.Delete);
+                        using var sr = new StreamReader(fs);
+                        var json = sr.ReadToEnd();
                         var options = new JsonSerializerOptions { PropertyNameCaseInsensitive = true };
                         var progressData = JsonSerializer.Deserialize<ProgressMessage>(json, options);
                         if (progressData != null && progress != null)
@@ -331,7 +344,16 @@ public class PythonWorkerService : IPythonWorkerService
         }
     }
 
-    private string BuildPythonArguments(TranscriptionJob job)
+    private string BuildPythonArguments()
+    {
+        // Check if debugger should be enabled via environment variable
+        var enableDebug = Environment.GetEnvironmentVariable("PYTHON_DEBUG") == "1";
+        var debugFlag = enableDebug ? " --debug" : "";
+
+        return $"\"{_settings.Python.ScriptPath}\" --config-stdin{debugFlag}";
+    }
+
+    private string BuildConfigJson(TranscriptionJob job)
     {
         try
         {
@@ -346,22 +368,17 @@ public class PythonWorkerService : IPythonWorkerService
                 device = job.Settings.Device,
                 fp16 = job.Settings.Fp16,
                 task = job.Settings.Task,
-                output_format = job.Settings.OutputFormat
+                output_format = job.Settings.OutputFormat,
+                keep_wav = !_settings.Processing.AutoDeleteWavFiles
             };
 
-            var configJson = JsonSerializer.Serialize(config);
-            var configBase64 = Convert.ToBase64String(Encoding.UTF8.GetBytes(configJson));
-
-            // Check if debugger should be enabled via environment variable
-            var enableDebug = Environment.GetEnvironmentVariable("PYTHON_DEBUG") == "1";
-            var debugFlag = enableDebug ? " --debug" : "";
-
-            return $"\"{_settings.Python.ScriptPath}\" --config {configBase64}{debugFlag}";
+            // Null values are left out so the worker applies its own default (fp16 = null means auto)
+            return JsonSerializer.Serialize(config, new JsonSerializerOptions { DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull });
         }
         catch (Exception ex)
         {
             Utilities.WriteToLog(ex);
-            _logService?.LogError($"Error building Python arguments: {ex.Message}", ex);
+            _logService?.LogError($"Error building Python configuration: {ex.Message}", ex);
             throw;
         }
     }
@@ -101,7 +101,7 @@ public class SettingsService : ISettingsService
                     Model = "base",
                     Language = "auto",
                     Device = "cpu",
-                    Fp16 = false,
+                    Fp16 = null, // Auto
                     Task = "transcribe",
                     OutputFormat = "srt"
                 },
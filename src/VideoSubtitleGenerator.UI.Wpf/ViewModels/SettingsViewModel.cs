@@ -413,7 +413,7 @@ public class SettingsViewModel : ViewModelBase
                     Device = Device,
                     Task = Task,
                     OutputFormat = SubtitleFormat.ToLower(), // srt, vtt, txt, json
-                    Fp16 = Device.ToLower() == "cuda" || Device.ToLower() == "gpu" // Auto FP16 for GPU
+                    Fp16 = null // Auto: the worker enables FP16 on GPUs that benefit from it
                 },
                 Processing = new ProcessingSettings
                 {
@@ -1,85 +0,0 @@
-﻿#pragma checksum "..\..\..\App.xaml" "{ff1816ec-aa5e-4d10-87f7-6f4963833460}" "B52AF0E6794A1D7C73FCD623C0E366E887BCD907"
-//------------------------------------------------------------------------------
-// <auto-generated>
-//     This code was generated by a tool.
-//     Runtime Version:4.0.30319.42000
-//
-//     Changes to this file may cause incorrect behavior and will be lost if
-//     the code is regenerated.
-// </auto-generated>
-//------------------------------------------------------------------------------
-
-using System;
-using System.Diagnostics;
-using System.Windows;
-using System.Windows.Automation;
-using System.Windows.Controls;
-using System.Windows.Controls.Primitives;
-using System.Windows.Controls.Ribbon;
-using System.Windows.Data;
-using System.Windows.Documents;
-using System.Windows.Ink;
-using System.Windows.Input;
-using System.Windows.Markup;
-using System.Windows.Media;
-using System.Windows.Media.Animation;
-using System.Windows.Media.Effects;
-using System.Windows.Media.Imaging;
-using System.Windows.Media.Media3D;
-using System.Windows.Media.TextFormatting;
-using System.Windows.Navigation;
-using System.Windows.Shapes;
-using System.Windows.Shell;
-using VideoSubtitleGenerator.UI.Wpf;
-using VideoSubtitleGenerator.UI.Wpf.Converters;
-
-
-namespace VideoSubtitleGenerator.UI.Wpf {
-    
-    
-    /// <summary>
-    /// App
-    /// </summary>
-    public partial class App : System.Windows.Application {
-        
-        private bool _contentLoaded;
-        
-        /// <summary>
-        /// InitializeComponent
-        /// </summary>
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        public void InitializeComponent() {
-            if (_contentLoaded) {
-                return;
-            }
-            _contentLoaded = true;
-            
-            #line 6 "..\..\..\App.xaml"
-            this.StartupUri = new System.Uri("UI/MainWindow.xaml", System.UriKind.Relative);
-            
-            #line default
-            #line hidden
-            System.Uri resourceLocater = new System.Uri("/VideoSubtitleGenerator.UI.Wpf;V1.0.0.0;component/app.xaml", System.UriKind.Relative);
-            
-            #line 1 "..\..\..\App.xaml"
-            System.Windows.Application.LoadComponent(this, resourceLocater);
-            
-            #line default
-            #line hidden
-        }
-        
-        /// <summary>
-        /// Application Entry Point.
-        /// </summary>
-        [System.STAThreadAttribute()]
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        public static void Main() {
-            VideoSubtitleGenerator.UI.Wpf.App app = new VideoSubtitleGenerator.UI.Wpf.App();
-            app.InitializeComponent();
-            app.Run();
-        }
-    }
-}
-
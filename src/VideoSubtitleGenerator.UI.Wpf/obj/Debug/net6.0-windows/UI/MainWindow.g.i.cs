@@ -1,222 +0,0 @@
-﻿#pragma checksum "..\..\..\..\UI\MainWindow.xaml" "{ff1816ec-aa5e-4d10-87f7-6f4963833460}" "470E80B25ACE7AB7F0D5705B8BCE1379722A2154"
-//------------------------------------------------------------------------------
-// <auto-generated>
-//     This code was generated by a tool.
-//     Runtime Version:4.0.30319.42000
-//
-//     Changes to this file may cause incorrect behavior and will be lost if
-//     the code is regenerated.
-// </auto-generated>
-//------------------------------------------------------------------------------
-
-using System;
-using System.Diagnostics;
-using System.Windows;
-using System.Windows.Automation;
-using System.Windows.Controls;
-using System.Windows.Controls.Primitives;
-using System.Windows.Controls.Ribbon;
-using System.Windows.Data;
-using System.Windows.Documents;
-using System.Windows.Ink;
-using System.Windows.Input;
-using System.Windows.Markup;
-using System.Windows.Media;
-using System.Windows.Media.Animation;
-using System.Windows.Media.Effects;
-using System.Windows.Media.Imaging;
-using System.Windows.Media.Media3D;
-using System.Windows.Media.TextFormatting;
-using System.Windows.Navigation;
-using System.Windows.Shapes;
-using System.Windows.Shell;
-using VideoSubtitleGenerator.UI.Wpf;
-
-
-namespace VideoSubtitleGenerator.UI.Wpf {
-    
-    
-    /// <summary>
-    /// MainWindow
-    /// </summary>
-    public partial class MainWindow : System.Windows.Window, System.Windows.Markup.IComponentConnector {
-        
-        
-        #line 40 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnAddFiles;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 80 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnRemove;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 119 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnStart;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 156 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnPause;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 192 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnStop;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 231 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnClearCompleted;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 270 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnOutputFolder;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 308 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnSettings;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 374 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.DataGrid jobsDataGrid;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 685 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ProgressBar overallProgressBar;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 773 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnClearLog;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 797 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnSaveLog;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 829 "..\..\..\..\UI\MainWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox logTextBox;
-        
-        #line default
-        #line hidden
-        
-        private bool _contentLoaded;
-        
-        /// <summary>
-        /// InitializeComponent
-        /// </summary>
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        public void InitializeComponent() {
-            if (_contentLoaded) {
-                return;
-            }
-            _contentLoaded = true;
-            System.Uri resourceLocater = new System.Uri("/VideoSubtitleGenerator.UI.Wpf;V1.0.0.0;component/ui/mainwindow.xaml", System.UriKind.Relative);
-            
-            #line 1 "..\..\..\..\UI\MainWindow.xaml"
-            System.Windows.Application.LoadComponent(this, resourceLocater);
-            
-            #line default
-            #line hidden
-        }
-        
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        [System.ComponentModel.EditorBrowsableAttribute(System.ComponentModel.EditorBrowsableState.Never)]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Design", "CA1033:InterfaceMethodsShouldBeCallableByChildTypes")]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Maintainability", "CA1502:AvoidExcessiveComplexity")]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1800:DoNotCastUnnecessarily")]
-        void System.Windows.Markup.IComponentConnector.Connect(int connectionId, object target) {
-            switch (connectionId)
-            {
-            case 1:
-            this.btnAddFiles = ((System.Windows.Controls.Button)(target));
-            return;
-            case 2:
-            this.btnRemove = ((System.Windows.Controls.Button)(target));
-            return;
-            case 3:
-            this.btnStart = ((System.Windows.Controls.Button)(target));
-            return;
-            case 4:
-            this.btnPause = ((System.Windows.Controls.Button)(target));
-            return;
-            case 5:
-            this.btnStop = ((System.Windows.Controls.Button)(target));
-            return;
-            case 6:
-            this.btnClearCompleted = ((System.Windows.Controls.Button)(target));
-            return;
-            case 7:
-            this.btnOutputFolder = ((System.Windows.Controls.Button)(target));
-            return;
-            case 8:
-            this.btnSettings = ((System.Windows.Controls.Button)(target));
-            return;
-            case 9:
-            this.jobsDataGrid = ((System.Windows.Controls.DataGrid)(target));
-            return;
-            case 10:
-            this.overallProgressBar = ((System.Windows.Controls.ProgressBar)(target));
-            return;
-            case 11:
-            this.btnClearLog = ((System.Windows.Controls.Button)(target));
-            return;
-            case 12:
-            this.btnSaveLog = ((System.Windows.Controls.Button)(target));
-            return;
-            case 13:
-            this.logTextBox = ((System.Windows.Controls.TextBox)(target));
-            return;
-            }
-            this._contentLoaded = true;
-        }
-    }
-}
-
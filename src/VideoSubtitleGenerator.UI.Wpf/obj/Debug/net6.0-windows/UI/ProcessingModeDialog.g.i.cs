@@ -1,150 +0,0 @@
-﻿#pragma checksum "..\..\..\..\UI\ProcessingModeDialog.xaml" "{ff1816ec-aa5e-4d10-87f7-6f4963833460}" "D4912918559CD8AC6169899D9A650A1567C32629"
-//------------------------------------------------------------------------------
-// <auto-generated>
-//     This code was generated by a tool.
-//     Runtime Version:4.0.30319.42000
-//
-//     Changes to this file may cause incorrect behavior and will be lost if
-//     the code is regenerated.
-// </auto-generated>
-//------------------------------------------------------------------------------
-
-using System;
-using System.Diagnostics;
-using System.Windows;
-using System.Windows.Automation;
-using System.Windows.Controls;
-using System.Windows.Controls.Primitives;
-using System.Windows.Controls.Ribbon;
-using System.Windows.Data;
-using System.Windows.Documents;
-using System.Windows.Ink;
-using System.Windows.Input;
-using System.Windows.Markup;
-using System.Windows.Media;
-using System.Windows.Media.Animation;
-using System.Windows.Media.Effects;
-using System.Windows.Media.Imaging;
-using System.Windows.Media.Media3D;
-using System.Windows.Media.TextFormatting;
-using System.Windows.Navigation;
-using System.Windows.Shapes;
-using System.Windows.Shell;
-using VideoSubtitleGenerator.UI.Wpf;
-
-
-namespace VideoSubtitleGenerator.UI.Wpf {
-    
-    
-    /// <summary>
-    /// ProcessingModeDialog
-    /// </summary>
-    public partial class ProcessingModeDialog : System.Windows.Window, System.Windows.Markup.IComponentConnector {
-        
-        
-        #line 162 "..\..\..\..\UI\ProcessingModeDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtDescription;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 177 "..\..\..\..\UI\ProcessingModeDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.RadioButton rbSequential;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 243 "..\..\..\..\UI\ProcessingModeDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.RadioButton rbParallel;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 295 "..\..\..\..\UI\ProcessingModeDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ComboBox cmbMaxParallelJobs;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 349 "..\..\..\..\UI\ProcessingModeDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.CheckBox chkRememberChoice;
-        
-        #line default
-        #line hidden
-        
-        private bool _contentLoaded;
-        
-        /// <summary>
-        /// InitializeComponent
-        /// </summary>
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        public void InitializeComponent() {
-            if (_contentLoaded) {
-                return;
-            }
-            _contentLoaded = true;
-            System.Uri resourceLocater = new System.Uri("/VideoSubtitleGenerator.UI.Wpf;V1.0.0.0;component/ui/processingmodedialog.xaml", System.UriKind.Relative);
-            
-            #line 1 "..\..\..\..\UI\ProcessingModeDialog.xaml"
-            System.Windows.Application.LoadComponent(this, resourceLocater);
-            
-            #line default
-            #line hidden
-        }
-        
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        [System.ComponentModel.EditorBrowsableAttribute(System.ComponentModel.EditorBrowsableState.Never)]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Design", "CA1033:InterfaceMethodsShouldBeCallableByChildTypes")]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Maintainability", "CA1502:AvoidExcessiveComplexity")]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1800:DoNotCastUnnecessarily")]
-        void System.Windows.Markup.IComponentConnector.Connect(int connectionId, object target) {
-            switch (connectionId)
-            {
-            case 1:
-            this.txtDescription = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 2:
-            this.rbSequential = ((System.Windows.Controls.RadioButton)(target));
-            return;
-            case 3:
-            this.rbParallel = ((System.Windows.Controls.RadioButton)(target));
-            return;
-            case 4:
-            this.cmbMaxParallelJobs = ((System.Windows.Controls.ComboBox)(target));
-            return;
-            case 5:
-            this.chkRememberChoice = ((System.Windows.Controls.CheckBox)(target));
-            return;
-            case 6:
-            
-            #line 371 "..\..\..\..\UI\ProcessingModeDialog.xaml"
-            ((System.Windows.Controls.Button)(target)).Click += new System.Windows.RoutedEventHandler(this.CancelButton_Click);
-            
-            #line default
-            #line hidden
-            return;
-            case 7:
-            
-            #line 376 "..\..\..\..\UI\ProcessingModeDialog.xaml"
-            ((System.Windows.Controls.Button)(target)).Click += new System.Windows.RoutedEventHandler(this.StartButton_Click);
-            
-            #line default
-            #line hidden
-            return;
-            }
-            this._contentLoaded = true;
-        }
-    }
-}
-
@@ -1,6 +0,0 @@
-// <auto-generated/>
-global using System;
-global using System.Collections.Generic;
-global using System.Linq;
-global using System.Threading;
-global using System.Threading.Tasks;
@@ -1,6 +0,0 @@
-// <auto-generated/>
-global using global::System;
-global using global::System.Collections.Generic;
-global using global::System.Linq;
-global using global::System.Threading;
-global using global::System.Threading.Tasks;
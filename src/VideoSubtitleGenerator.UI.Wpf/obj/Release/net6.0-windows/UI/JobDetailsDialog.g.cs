@@ -1,310 +0,0 @@
-﻿#pragma checksum "..\..\..\..\UI\JobDetailsDialog.xaml" "{ff1816ec-aa5e-4d10-87f7-6f4963833460}" "CCFE3CBE7C264BA2933C46BD7D05672F5DD83B74"
-//------------------------------------------------------------------------------
-// <auto-generated>
-//     This code was generated by a tool.
-//     Runtime Version:4.0.30319.42000
-//
-//     Changes to this file may cause incorrect behavior and will be lost if
-//     the code is regenerated.
-// </auto-generated>
-//------------------------------------------------------------------------------
-
-using System;
-using System.Diagnostics;
-using System.Windows;
-using System.Windows.Automation;
-using System.Windows.Controls;
-using System.Windows.Controls.Primitives;
-using System.Windows.Controls.Ribbon;
-using System.Windows.Data;
-using System.Windows.Documents;
-using System.Windows.Ink;
-using System.Windows.Input;
-using System.Windows.Markup;
-using System.Windows.Media;
-using System.Windows.Media.Animation;
-using System.Windows.Media.Effects;
-using System.Windows.Media.Imaging;
-using System.Windows.Media.Media3D;
-using System.Windows.Media.TextFormatting;
-using System.Windows.Navigation;
-using System.Windows.Shapes;
-using System.Windows.Shell;
-using VideoSubtitleGenerator.UI.Wpf;
-
-
-namespace VideoSubtitleGenerator.UI.Wpf {
-    
-    
-    /// <summary>
-    /// JobDetailsDialog
-    /// </summary>
-    public partial class JobDetailsDialog : System.Windows.Window, System.Windows.Markup.IComponentConnector {
-        
-        
-        #line 117 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtJobTitle;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 159 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtFileName;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 170 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtFilePath;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 185 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtFileSize;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 196 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtDuration;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 207 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtFormat;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 250 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtStatus;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 264 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtProgress;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 274 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Border progressFill;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 288 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtStartTime;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 300 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtElapsed;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 312 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtEstRemaining;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 328 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtCurrentPhase;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 347 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtModel;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 363 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtLanguage;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 407 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox txtDetailedLog;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 443 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtWavPath;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 463 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBlock txtSrtPath;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 492 "..\..\..\..\UI\JobDetailsDialog.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.Button btnRetry;
-        
-        #line default
-        #line hidden
-        
-        private bool _contentLoaded;
-        
-        /// <summary>
-        /// InitializeComponent
-        /// </summary>
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        public void InitializeComponent() {
-            if (_contentLoaded) {
-                return;
-            }
-            _contentLoaded = true;
-            System.Uri resourceLocater = new System.Uri("/VideoSubtitleGenerator.UI.Wpf;component/ui/jobdetailsdialog.xaml", System.UriKind.Relative);
-            
-            #line 1 "..\..\..\..\UI\JobDetailsDialog.xaml"
-            System.Windows.Application.LoadComponent(this, resourceLocater);
-            
-            #line default
-            #line hidden
-        }
-        
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        [System.ComponentModel.EditorBrowsableAttribute(System.ComponentModel.EditorBrowsableState.Never)]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Design", "CA1033:InterfaceMethodsShouldBeCallableByChildTypes")]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Maintainability", "CA1502:AvoidExcessiveComplexity")]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1800:DoNotCastUnnecessarily")]
-        void System.Windows.Markup.IComponentConnector.Connect(int connectionId, object target) {
-            switch (connectionId)
-            {
-            case 1:
-            this.txtJobTitle = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 2:
-            this.txtFileName = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 3:
-            this.txtFilePath = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 4:
-            this.txtFileSize = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 5:
-            this.txtDuration = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 6:
-            this.txtFormat = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 7:
-            this.txtStatus = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 8:
-            this.txtProgress = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 9:
-            this.progressFill = ((System.Windows.Controls.Border)(target));
-            return;
-            case 10:
-            this.txtStartTime = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 11:
-            this.txtElapsed = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 12:
-            this.txtEstRemaining = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 13:
-            this.txtCurrentPhase = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 14:
-            this.txtModel = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 15:
-            this.txtLanguage = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 16:
-            this.txtDetailedLog = ((System.Windows.Controls.TextBox)(target));
-            return;
-            case 17:
-            this.txtWavPath = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 18:
-            this.txtSrtPath = ((System.Windows.Controls.TextBlock)(target));
-            return;
-            case 19:
-            
-            #line 491 "..\..\..\..\UI\JobDetailsDialog.xaml"
-            ((System.Windows.Controls.Button)(target)).Click += new System.Windows.RoutedEventHandler(this.OpenOutputFolder_Click);
-            
-            #line default
-            #line hidden
-            return;
-            case 20:
-            this.btnRetry = ((System.Windows.Controls.Button)(target));
-            
-            #line 498 "..\..\..\..\UI\JobDetailsDialog.xaml"
-            this.btnRetry.Click += new System.Windows.RoutedEventHandler(this.Retry_Click);
-            
-            #line default
-            #line hidden
-            return;
-            case 21:
-            
-            #line 504 "..\..\..\..\UI\JobDetailsDialog.xaml"
-            ((System.Windows.Controls.Button)(target)).Click += new System.Windows.RoutedEventHandler(this.Close_Click);
-            
-            #line default
-            #line hidden
-            return;
-            }
-            this._contentLoaded = true;
-        }
-    }
-}
-
@@ -1,284 +0,0 @@
-﻿#pragma checksum "..\..\..\..\UI\SettingsWindow.xaml" "{ff1816ec-aa5e-4d10-87f7-6f4963833460}" "E9128DB3D9C6F461DC977D88EA5E64BD74C98211"
-//------------------------------------------------------------------------------
-// <auto-generated>
-//     This code was generated by a tool.
-//     Runtime Version:4.0.30319.42000
-//
-//     Changes to this file may cause incorrect behavior and will be lost if
-//     the code is regenerated.
-// </auto-generated>
-//------------------------------------------------------------------------------
-
-using System;
-using System.Diagnostics;
-using System.Windows;
-using System.Windows.Automation;
-using System.Windows.Controls;
-using System.Windows.Controls.Primitives;
-using System.Windows.Controls.Ribbon;
-using System.Windows.Data;
-using System.Windows.Documents;
-using System.Windows.Ink;
-using System.Windows.Input;
-using System.Windows.Markup;
-using System.Windows.Media;
-using System.Windows.Media.Animation;
-using System.Windows.Media.Effects;
-using System.Windows.Media.Imaging;
-using System.Windows.Media.Media3D;
-using System.Windows.Media.TextFormatting;
-using System.Windows.Navigation;
-using System.Windows.Shapes;
-using System.Windows.Shell;
-using VideoSubtitleGenerator.UI.Wpf;
-
-
-namespace VideoSubtitleGenerator.UI.Wpf {
-    
-    
-    /// <summary>
-    /// SettingsWindow
-    /// </summary>
-    public partial class SettingsWindow : System.Windows.Window, System.Windows.Markup.IComponentConnector {
-        
-        
-        #line 102 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TabControl mainTabControl;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 176 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox txtPythonPath;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 202 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox txtFFmpegPath;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 230 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox txtScriptPath;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 270 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox txtRetryCount;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 288 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox txtRetryDelay;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 343 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ComboBox cmbLogLevel;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 360 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox txtLogPath;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 414 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ComboBox cmbWhisperModel;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 470 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ComboBox cmbLanguage;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 497 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ComboBox cmbDevice;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 564 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ComboBox cmbSubtitleFormat;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 659 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.TextBox txtOutputDirectory;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 769 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ComboBox cmbSampleRate;
-        
-        #line default
-        #line hidden
-        
-        
-        #line 786 "..\..\..\..\UI\SettingsWindow.xaml"
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1823:AvoidUnusedPrivateFields")]
-        internal System.Windows.Controls.ComboBox cmbChannels;
-        
-        #line default
-        #line hidden
-        
-        private bool _contentLoaded;
-        
-        /// <summary>
-        /// InitializeComponent
-        /// </summary>
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        public void InitializeComponent() {
-            if (_contentLoaded) {
-                return;
-            }
-            _contentLoaded = true;
-            System.Uri resourceLocater = new System.Uri("/VideoSubtitleGenerator.UI.Wpf;component/ui/settingswindow.xaml", System.UriKind.Relative);
-            
-            #line 1 "..\..\..\..\UI\SettingsWindow.xaml"
-            System.Windows.Application.LoadComponent(this, resourceLocater);
-            
-            #line default
-            #line hidden
-        }
-        
-        [System.Diagnostics.DebuggerNonUserCodeAttribute()]
-        [System.CodeDom.Compiler.GeneratedCodeAttribute("PresentationBuildTasks", "10.0.0.0")]
-        [System.ComponentModel.EditorBrowsableAttribute(System.ComponentModel.EditorBrowsableState.Never)]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Design", "CA1033:InterfaceMethodsShouldBeCallableByChildTypes")]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Maintainability", "CA1502:AvoidExcessiveComplexity")]
-        [System.Diagnostics.CodeAnalysis.SuppressMessageAttribute("Microsoft.Performance", "CA1800:DoNotCastUnnecessarily")]
-        void System.Windows.Markup.IComponentConnector.Connect(int connectionId, object target) {
-            switch (connectionId)
-            {
-            case 1:
-            this.mainTabControl = ((System.Windows.Controls.TabControl)(target));
-            return;
-            case 2:
-            this.txtPythonPath = ((System.Windows.Controls.TextBox)(target));
-            return;
-            case 3:
-            this.txtFFmpegPath = ((System.Windows.Controls.TextBox)(target));
-            return;
-            case 4:
-            this.txtScriptPath = ((System.Windows.Controls.TextBox)(target));
-            return;
-            case 5:
-            this.txtRetryCount = ((System.Windows.Controls.TextBox)(target));
-            return;
-            case 6:
-            this.txtRetryDelay = ((System.Windows.Controls.TextBox)(target));
-            return;
-            case 7:
-            this.cmbLogLevel = ((System.Windows.Controls.ComboBox)(target));
-            return;
-            case 8:
-            this.txtLogPath = ((System.Windows.Controls.TextBox)(target));
-            return;
-            case 9:
-            this.cmbWhisperModel = ((System.Windows.Controls.ComboBox)(target));
-            return;
-            case 10:
-            this.cmbLanguage = ((System.Windows.Controls.ComboBox)(target));
-            return;
-            case 11:
-            this.cmbDevice = ((System.Windows.Controls.ComboBox)(target));
-            return;
-            case 12:
-            this.cmbSubtitleFormat = ((System.Windows.Controls.ComboBox)(target));
-            return;
-            case 13:
-            this.txtOutputDirectory = ((System.Windows.Controls.TextBox)(target));
-            return;
-            case 14:
-            this.cmbSampleRate = ((System.Windows.Controls.ComboBox)(target));
-            return;
-            case 15:
-            this.cmbChannels = ((System.Windows.Controls.ComboBox)(target));
-            return;
-            case 16:
-            
-            #line 901 "..\..\..\..\UI\SettingsWindow.xaml"
-            ((System.Windows.Documents.Hyperlink)(target)).RequestNavigate += new System.Windows.Navigation.RequestNavigateEventHandler(this.Hyperlink_RequestNavigate);
-            
-            #line default
-            #line hidden
-            return;
-            case 17:
-            
-            #line 908 "..\..\..\..\UI\SettingsWindow.xaml"
-            ((System.Windows.Documents.Hyperlink)(target)).RequestNavigate += new System.Windows.Navigation.RequestNavigateEventHandler(this.Hyperlink_RequestNavigate);
-            
-            #line default
-            #line hidden
-            return;
-            case 18:
-            
-            #line 915 "..\..\..\..\UI\SettingsWindow.xaml"
-            ((System.Windows.Documents.Hyperlink)(target)).RequestNavigate += new System.Windows.Navigation.RequestNavigateEventHandler(this.Hyperlink_RequestNavigate);
-            
-            #line default
-            #line hidden
-            return;
-            case 19:
-            
-            #line 970 "..\..\..\..\UI\SettingsWindow.xaml"
-            ((System.Windows.Controls.Button)(target)).Click += new System.Windows.RoutedEventHandler(this.CancelButton_Click);
-            
-            #line default
-            #line hidden
-            return;
-            case 20:
-            
-            #line 982 "..\..\..\..\UI\SettingsWindow.xaml"
-            ((System.Windows.Controls.Button)(target)).Click += new System.Windows.RoutedEventHandler(this.SaveButton_Click);
-            
-            #line default
-            #line hidden
-            return;
-            }
-            this._contentLoaded = true;
-        }
-    }
-}
-